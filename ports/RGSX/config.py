@@ -347,6 +347,11 @@ current_platform = 0  # Index de la plateforme actuelle sélectionnée
 platform_names = {}  # {platform_id: platform_name}
 games_count = {}  # Dictionnaire comptant le nombre de jeux par plateforme
 platform_dicts = []  # Liste des dictionnaires de plateformes
+platform_dict_by_name = {}  # {platform_name: platform_dict} (construit par load_sources)
+dest_folder_by_platform = {}  # {platform_name: nom du dossier ROM de destination} (construit par load_sources)
+extensions_by_folder = {}  # {folder: frozenset(extensions)} (construit avec le cache des extensions)
+system_images_version = 0  # incrémenté quand les images système doivent être rechargées (voir utils.invalidate_system_image_cache)
+font_generation = 0  # incrémenté à chaque (ré)initialisation des polices (voir utils._char_width)
 
 # Filtre plateformes
 selected_filter_index = 0  # index dans la liste visible triée
@@ -478,7 +483,8 @@ except Exception as e:
 
 def init_font():
     """Initialise les polices après pygame.init() en fonction de la famille choisie."""
-    global font, progress_font, title_font, search_font, small_font
+    global font, progress_font, title_font, search_font, small_font, font_generation
+    font_generation += 1
     font_scale = accessibility_settings.get("font_scale", 1.0)
 
     # Déterminer la famille sélectionnée
@@ -529,7 +535,8 @@ def init_font():
 
 def init_footer_font():
     """Initialise uniquement la police du footer (tiny_font) en fonction de l'échelle séparée."""
-    global tiny_font
+    global tiny_font, font_generation
+    font_generation += 1
     footer_font_scale = accessibility_settings.get("footer_font_scale", 1.0)
     
     # Déterminer la famille sélectionnée
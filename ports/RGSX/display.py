@@ -791,13 +791,17 @@ def get_control_display(action, default):
     # Fallback vers l'ancien système ou valeur par défaut
     return control_config.get('display', default)
 
-# Cache pour les images des plateformes
+# Cache pour les images des plateformes (vidé quand config.system_images_version change)
 platform_images_cache = {}
+_platform_images_version = 0
 
 # Grille des systèmes 3x3
 def draw_platform_grid(screen):
     """Affiche la grille des plateformes avec un style moderne et fluide."""
-    global platform_images_cache
+    global platform_images_cache, _platform_images_version
+    if _platform_images_version != config.system_images_version:
+        platform_images_cache.clear()
+        _platform_images_version = config.system_images_version
     
     # Vérifier si le mode performance est activé
     from rgsx_settings import get_light_mode
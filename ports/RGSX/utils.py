@@ -14,10 +14,22 @@ try:
         pygame = None  # type: ignore
 except Exception:
     pygame = None  # type: ignore
+try:
+    import ijson  # type: ignore  # optionnel: comptage/lecture en flux des gros fichiers de jeux
+except Exception:
+    ijson = None  # type: ignore
+try:
+    import libarchive  # type: ignore  # optionnel (libarchive-c): extraction RAR sans unrar
+except Exception:
+    libarchive = None  # type: ignore
 import glob
 import threading
+import concurrent.futures
 from rgsx_settings import load_rgsx_settings, save_rgsx_settings, get_allow_unknown_extensions
 import zipfile
+import functools
+import collections
+import io
 import time
 import random
 import config
@@ -134,10 +146,16 @@ def generate_support_zip():
         with zipfile.ZipFile(zip_path, 'w', zipfile.ZIP_DEFLATED) as zipf:
             for archive_name, file_path in files_to_include:
                 try:
-                    zipf.write(file_path, archive_name)
-                    logger.debug(f"Ajouté au ZIP: {archive_name}")
+                    # Copie en flux (tampon 64 Ko) pour garder une mémoire constante sur les gros logs
+                    zinfo = zipfile.ZipInfo.from_file(file_path, archive_name)
+                    zinfo.compress_type = zipfile.ZIP_DEFLATED
+                    with open(file_path, 'rb') as src, zipf.open(zinfo, 'w', force_zip64=True) as dst:
+                        shutil.copyfileobj(src, dst, 1 << 16)
+                    if logger.isEnabledFor(logging.DEBUG):
+                        logger.debug("Ajouté au ZIP: %s", archive_name)
                 except Exception as e:
                     logger.warning(f"Impossible d'ajouter {archive_name}: {e}")
+            logger.info("ZIP contient %d fichiers", len(files_to_include))
             
             # Ajouter un fichier README avec des informations système
             readme_content = f"""RGSX Support Package
@@ -171,6 +189,32 @@ DO NOT share this file publicly as it may contain sensitive information.
         return (False, str(e), None)
 
 
+# Chemins des services Batocera (constants) et sources dans assets/progs (résolues au premier usage)
+_SERVICES_DIR = "/userdata/system/services"
+_WEB_SERVICE_FILE = _SERVICES_DIR + "/rgsx_web"
+_CUSTOM_DNS_SERVICE_FILE = _SERVICES_DIR + "/custom_dns"
+_service_source_files = {}
+
+
+def _get_service_source_file(name):
+    """Retourne le chemin du fichier service fourni dans assets/progs (mis en cache)."""
+    path = _service_source_files.get(name)
+    if path is None:
+        path = os.path.join(config.APP_FOLDER, "assets", "progs", name)
+        _service_source_files[name] = path
+    return path
+
+
+def _run_batocera_services(action, service):
+    """Exécute `batocera-services <action> <service>`.
+    stdout n'est capturé qu'en niveau DEBUG (seul usage: les logs debug); stderr reste disponible pour les erreurs.
+    """
+    cmd = ['batocera-services', action, service]
+    if logger.isEnabledFor(logging.DEBUG):
+        return subprocess.run(cmd, capture_output=True, text=True, timeout=5)
+    return subprocess.run(cmd, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, text=True, timeout=5)
+
+
 def toggle_web_service_at_boot(enable: bool):
     """Active ou désactive le service web au démarrage de Batocera.
     
@@ -187,9 +231,17 @@ def toggle_web_service_at_boot(enable: bool):
         if config.OPERATING_SYSTEM != "Linux":
             return (False, "Web service auto-start is only available on Batocera/Linux systems")
         
-        services_dir = "/userdata/system/services"
-        service_file = os.path.join(services_dir, "rgsx_web")
-        source_file = os.path.join(config.APP_FOLDER, "assets", "progs", "rgsx_web")
+        services_dir = _SERVICES_DIR
+        service_file = _WEB_SERVICE_FILE
+        source_file = _get_service_source_file("rgsx_web")
+        
+        # Rien à faire si l'état persisté correspond déjà à la cible (et que le fichier service est en place)
+        current = bool(load_rgsx_settings().get("web_service_at_boot", False))
+        if current == enable and (not enable or os.path.exists(service_file)):
+            logger.debug("Service rgsx_web déjà dans l'état demandé (%s), aucun appel batocera-services", enable)
+            if enable:
+                return (True, _("settings_web_service_success_enabled") if _ else "Web service enabled at boot")
+            return (True, _("settings_web_service_success_disabled") if _ else "✓ Web service disabled at boot")
         
         if enable:
             # Mode ENABLE
@@ -198,7 +250,7 @@ def toggle_web_service_at_boot(enable: bool):
             # 1. Créer le dossier services s'il n'existe pas
             try:
                 os.makedirs(services_dir, exist_ok=True)
-                logger.debug(f"Dossier services vérifié/créé: {services_dir}")
+                logger.debug("Dossier services vérifié/créé: %s", services_dir)
             except Exception as e:
                 error_msg = f"Failed to create services directory: {str(e)}"
                 logger.error(error_msg)
@@ -213,7 +265,7 @@ def toggle_web_service_at_boot(enable: bool):
                 
                 shutil.copy2(source_file, service_file)
                 os.chmod(service_file, 0o755)  # Rendre exécutable
-                logger.debug(f"Fichier service copié et rendu exécutable: {service_file}")
+                logger.debug("Fichier service copié et rendu exécutable: %s", service_file)
             except Exception as e:
                 error_msg = f"Failed to copy service file: {str(e)}"
                 logger.error(error_msg)
@@ -221,17 +273,12 @@ def toggle_web_service_at_boot(enable: bool):
             
             # 3. Activer le service avec batocera-services
             try:
-                result = subprocess.run(
-                    ['batocera-services', 'enable', 'rgsx_web'],
-                    capture_output=True,
-                    text=True,
-                    timeout=10
-                )
+                result = _run_batocera_services('enable', 'rgsx_web')
                 if result.returncode != 0:
                     error_msg = f"batocera-services enable failed: {result.stderr}"
                     logger.error(error_msg)
                     return (False, error_msg)
-                logger.debug(f"Service activé: {result.stdout}")
+                logger.debug("Service activé: %s", result.stdout)
             except FileNotFoundError:
                 error_msg = "batocera-services command not found"
                 logger.error(error_msg)
@@ -243,17 +290,12 @@ def toggle_web_service_at_boot(enable: bool):
             
             # 4. Démarrer le service immédiatement
             try:
-                result = subprocess.run(
-                    ['batocera-services', 'start', 'rgsx_web'],
-                    capture_output=True,
-                    text=True,
-                    timeout=10
-                )
+                result = _run_batocera_services('start', 'rgsx_web')
                 if result.returncode != 0:
                     # Le service peut ne pas démarrer si déjà en cours, ce n'est pas grave
                     logger.warning(f"batocera-services start warning: {result.stderr}")
                 else:
-                    logger.debug(f"Service démarré: {result.stdout}")
+                    logger.debug("Service démarré: %s", result.stdout)
             except Exception as e:
                 logger.warning(f"Failed to start service (non-critical): {str(e)}")
             
@@ -273,17 +315,12 @@ def toggle_web_service_at_boot(enable: bool):
             
             # 1. Désactiver le service avec batocera-services
             try:
-                result = subprocess.run(
-                    ['batocera-services', 'disable', 'rgsx_web'],
-                    capture_output=True,
-                    text=True,
-                    timeout=10
-                )
+                result = _run_batocera_services('disable', 'rgsx_web')
                 if result.returncode != 0:
                     error_msg = f"batocera-services disable failed: {result.stderr}"
                     logger.error(error_msg)
                     return (False, error_msg)
-                logger.debug(f"Service désactivé: {result.stdout}")
+                logger.debug("Service désactivé: %s", result.stdout)
             except FileNotFoundError:
                 error_msg = "batocera-services command not found"
                 logger.error(error_msg)
@@ -323,9 +360,17 @@ def toggle_custom_dns_at_boot(enable: bool):
         if config.OPERATING_SYSTEM != "Linux":
             return (False, "Custom DNS service is only available on Batocera/Linux systems")
         
-        services_dir = "/userdata/system/services"
-        service_file = os.path.join(services_dir, "custom_dns")
-        source_file = os.path.join(config.APP_FOLDER, "assets", "progs", "custom_dns")
+        services_dir = _SERVICES_DIR
+        service_file = _CUSTOM_DNS_SERVICE_FILE
+        source_file = _get_service_source_file("custom_dns")
+        
+        # Rien à faire si l'état persisté correspond déjà à la cible (et que le fichier service est en place)
+        current = bool(load_rgsx_settings().get("custom_dns_at_boot", False))
+        if current == enable and (not enable or os.path.exists(service_file)):
+            logger.debug("Service custom_dns déjà dans l'état demandé (%s), aucun appel batocera-services", enable)
+            if enable:
+                return (True, _("settings_custom_dns_success_enabled") if _ else "Custom DNS enabled at boot")
+            return (True, _("settings_custom_dns_success_disabled") if _ else "✓ Custom DNS disabled at boot")
         
         if enable:
             # Mode ENABLE
@@ -334,7 +379,7 @@ def toggle_custom_dns_at_boot(enable: bool):
             # 1. Créer le dossier services s'il n'existe pas
             try:
                 os.makedirs(services_dir, exist_ok=True)
-                logger.debug(f"Dossier services vérifié/créé: {services_dir}")
+                logger.debug("Dossier services vérifié/créé: %s", services_dir)
             except Exception as e:
                 error_msg = f"Failed to create services directory: {str(e)}"
                 logger.error(error_msg)
@@ -349,7 +394,7 @@ def toggle_custom_dns_at_boot(enable: bool):
                 
                 shutil.copy2(source_file, service_file)
                 os.chmod(service_file, 0o755)  # Rendre exécutable
-                logger.debug(f"Fichier service copié et rendu exécutable: {service_file}")
+                logger.debug("Fichier service copié et rendu exécutable: %s", service_file)
             except Exception as e:
                 error_msg = f"Failed to copy service file: {str(e)}"
                 logger.error(error_msg)
@@ -357,17 +402,12 @@ def toggle_custom_dns_at_boot(enable: bool):
             
             # 3. Activer le service avec batocera-services
             try:
-                result = subprocess.run(
-                    ['batocera-services', 'enable', 'custom_dns'],
-                    capture_output=True,
-                    text=True,
-                    timeout=10
-                )
+                result = _run_batocera_services('enable', 'custom_dns')
                 if result.returncode != 0:
                     error_msg = f"batocera-services enable failed: {result.stderr}"
                     logger.error(error_msg)
                     return (False, error_msg)
-                logger.debug(f"Service activé: {result.stdout}")
+                logger.debug("Service activé: %s", result.stdout)
             except FileNotFoundError:
                 error_msg = "batocera-services command not found"
                 logger.error(error_msg)
@@ -379,17 +419,12 @@ def toggle_custom_dns_at_boot(enable: bool):
             
             # 4. Démarrer le service immédiatement
             try:
-                result = subprocess.run(
-                    ['batocera-services', 'start', 'custom_dns'],
-                    capture_output=True,
-                    text=True,
-                    timeout=10
-                )
+                result = _run_batocera_services('start', 'custom_dns')
                 if result.returncode != 0:
                     # Le service peut ne pas démarrer si déjà en cours, ce n'est pas grave
                     logger.warning(f"batocera-services start warning: {result.stderr}")
                 else:
-                    logger.debug(f"Service démarré: {result.stdout}")
+                    logger.debug("Service démarré: %s", result.stdout)
             except Exception as e:
                 logger.warning(f"Failed to start service (non-critical): {str(e)}")
             
@@ -409,17 +444,12 @@ def toggle_custom_dns_at_boot(enable: bool):
             
             # 1. Désactiver le service avec batocera-services
             try:
-                result = subprocess.run(
-                    ['batocera-services', 'disable', 'custom_dns'],
-                    capture_output=True,
-                    text=True,
-                    timeout=10
-                )
+                result = _run_batocera_services('disable', 'custom_dns')
                 if result.returncode != 0:
                     error_msg = f"batocera-services disable failed: {result.stderr}"
                     logger.error(error_msg)
                     return (False, error_msg)
-                logger.debug(f"Service désactivé: {result.stdout}")
+                logger.debug("Service désactivé: %s", result.stdout)
             except FileNotFoundError:
                 error_msg = "batocera-services command not found"
                 logger.error(error_msg)
@@ -431,16 +461,11 @@ def toggle_custom_dns_at_boot(enable: bool):
             
             # 2. Arrêter le service immédiatement
             try:
-                result = subprocess.run(
-                    ['batocera-services', 'stop', 'custom_dns'],
-                    capture_output=True,
-                    text=True,
-                    timeout=10
-                )
+                result = _run_batocera_services('stop', 'custom_dns')
                 if result.returncode != 0:
                     logger.warning(f"batocera-services stop warning: {result.stderr}")
                 else:
-                    logger.debug(f"Service arrêté: {result.stdout}")
+                    logger.debug("Service arrêté: %s", result.stdout)
             except Exception as e:
                 logger.warning(f"Failed to stop service (non-critical): {str(e)}")
             
@@ -481,16 +506,41 @@ def check_custom_dns_status():
 
 
 _extensions_cache = None  # type: ignore
+_extensions_index = None  # type: ignore  # {folder: frozenset(extensions)}
+# {platform_key: frozenset(extensions) ou None}: dossier de chaque plateforme résolu une seule fois
+# (vidé quand l'index des extensions ou les dossiers des plateformes changent)
+_platform_ext_sets = {}
+# Index construit pour des extensions_data fournies par l'appelant (réutilisé tant que c'est le même objet)
+_foreign_extensions_index = {"data": None, "index": None}
 _extensions_json_regenerated = False
 
 
+def _build_extensions_index(data):
+    """Construit l'index {folder: frozenset(extensions)} (première entrée prioritaire, comme le scan linéaire)."""
+    index = {}
+    for entry in data or []:
+        if isinstance(entry, dict) and entry.get("folder") and entry["folder"] not in index:
+            index[entry["folder"]] = frozenset(entry.get("extensions") or ())
+    return index
+
+
+def get_extensions_index():
+    """Retourne l'index {folder: frozenset(extensions)} construit avec le cache des extensions."""
+    global _extensions_index
+    if _extensions_index is None:
+        _extensions_index = _build_extensions_index(load_extensions_json())
+        config.extensions_by_folder = _extensions_index
+        _platform_ext_sets.clear()
+    return _extensions_index
+
+
 # Fonction pour charger le fichier JSON des extensions supportées
 def load_extensions_json():
     """Charge le JSON des extensions supportées.
     - Régénère une seule fois par exécution (au premier appel ou si le fichier est absent).
     - Met en cache le résultat pour éviter les relectures et logs répétés.
     """
-    global _extensions_cache, _extensions_json_regenerated
+    global _extensions_cache, _extensions_index, _extensions_json_regenerated
     try:
         # Retour immédiat si déjà en cache
         if _extensions_cache is not None:
@@ -516,19 +566,33 @@ def load_extensions_json():
         if os.path.exists(config.JSON_EXTENSIONS):
             with open(config.JSON_EXTENSIONS, 'r', encoding='utf-8') as f:
                 _extensions_cache = json.load(f)
+                _extensions_index = config.extensions_by_folder = _build_extensions_index(_extensions_cache)
+                _platform_ext_sets.clear()
                 return _extensions_cache
         _extensions_cache = []
+        _extensions_index = config.extensions_by_folder = {}
+        _platform_ext_sets.clear()
         return _extensions_cache
     except Exception as e:
         logger.error(f"Erreur lors de la lecture de {config.JSON_EXTENSIONS}: {e}")
         _extensions_cache = []
+        _extensions_index = config.extensions_by_folder = {}
+        _platform_ext_sets.clear()
         return _extensions_cache
 
+def _try_stat(path):
+    """Retourne os.stat(path) ou None si le chemin est absent/inaccessible."""
+    try:
+        return os.stat(path)
+    except OSError:
+        return None
+
 def _detect_es_systems_cfg_paths():
-    """Retourne une liste de chemins possibles pour es_systems.cfg selon l'OS.
+    """Retourne la liste des es_systems.cfg existants selon l'OS, sous forme de tuples (chemin, os.stat_result).
     - RetroBat (Windows): {config.USERDATA_FOLDER}\\system\\templates\\emulationstation\\es_systems.cfg
     - Batocera (Linux): /usr/share/emulationstation/es_systems.cfg
       Ajoute aussi les fichiers customs: /userdata/system/configs/emulationstation/es_systems_*.cfg
+    Le stat est conservé pour que l'appelant puisse réutiliser le mtime sans nouvel appel système.
     """
     candidates = []
     try:
@@ -543,19 +607,20 @@ def _detect_es_systems_cfg_paths():
             # Batocera customs
             custom_dir = '/userdata/system/configs/emulationstation'
             try:
-                for p in glob.glob(os.path.join(custom_dir, 'es_systems_*.cfg')):
-                    candidates.append(p)
-                direct_cfg = os.path.join(custom_dir, 'es_systems.cfg')
-                if os.path.exists(direct_cfg):
-                    candidates.append(direct_cfg)
+                candidates.extend(glob.glob(os.path.join(custom_dir, 'es_systems_*.cfg')))
+                candidates.append(os.path.join(custom_dir, 'es_systems.cfg'))
             except Exception:
                 pass
     except Exception:
         pass
-    existing = [p for p in candidates if p and os.path.exists(p)]
+    # Un seul stat par candidat (l'existence est vérifiée ici uniquement)
+    existing = [(p, st) for p in candidates if p and (st := _try_stat(p)) is not None]
     # Logs réduits: on ne conserve que les résumés plus loin
     return existing
 
+_PATH_TRANS = str.maketrans('\\', '/')
+_ROMS_MARKER = '/roms/'
+
 def _parse_es_systems_cfg(cfg_path):
     """Parse un es_systems.cfg minimalement pour extraire (folder, extensions).
     Retourne une liste de dicts: { 'folder': <str>, 'extensions': [..] }
@@ -563,24 +628,52 @@ def _parse_es_systems_cfg(cfg_path):
     - extensions: liste normalisée de .ext (point + minuscule)
     """
     try:
-        # Lire tel quel (pas besoin d'un parseur XML strict, mais ElementTree suffit)
-        import xml.etree.ElementTree as ET
-    # Log détaillé supprimé pour alléger les traces
-        tree = ET.parse(cfg_path)
-        root = tree.getroot()
+        # Parseur expat (C) en flux: on ne garde que <path> et <extension> des <system>,
+        # sans construire d'arbre d'éléments
+        import xml.parsers.expat
+        systems = []  # (path_text, ext_text)
+        stack = []
+        current = {}
+        text_parts = []
+
+        def on_start(name, attrs):
+            stack.append(name)
+            if len(stack) == 2 and name == 'system':
+                current.clear()
+            elif len(stack) == 3 and stack[1] == 'system' and name in ('path', 'extension'):
+                text_parts.clear()
+
+        def on_chars(data):
+            if len(stack) == 3 and stack[1] == 'system' and stack[2] in ('path', 'extension'):
+                text_parts.append(data)
+
+        def on_end(name):
+            if len(stack) == 3 and stack[1] == 'system' and name in ('path', 'extension'):
+                # Comme findtext: seule la première occurrence compte
+                current.setdefault(name, ''.join(text_parts))
+            elif len(stack) == 2 and name == 'system':
+                systems.append((current.get('path', ''), current.get('extension', '')))
+            stack.pop()
+
+        parser = xml.parsers.expat.ParserCreate()
+        parser.StartElementHandler = on_start
+        parser.EndElementHandler = on_end
+        parser.CharacterDataHandler = on_chars
+        with open(cfg_path, 'rb') as f:
+            parser.ParseFile(f)
+
         out = []
-        for sys_elem in root.findall('system'):
-            path_text = (sys_elem.findtext('path') or '').strip()
-            ext_text = (sys_elem.findtext('extension') or '').strip()
+        for path_text, ext_text in systems:
+            path_text = path_text.strip()
+            ext_text = ext_text.strip()
             if not path_text:
                 continue
             # Extraire le dossier après 'roms'
             folder = None
-            norm = path_text.replace('\\', '/').lower()
-            marker = '/roms/'
-            if marker in norm:
-                after = norm.split(marker, 1)[1]
-                folder = after.strip().strip('/\\')
+            norm = path_text.translate(_PATH_TRANS).lower()
+            idx = norm.find(_ROMS_MARKER)
+            if idx >= 0:
+                folder = norm[idx + len(_ROMS_MARKER):].strip().strip('/')
             if not folder:
                 # fallback: si le chemin finit par .../roms/<folder>
                 parts = norm.strip('/').split('/')
@@ -589,23 +682,12 @@ def _parse_es_systems_cfg(cfg_path):
             if not folder:
                 continue
 
-            # Extensions: split par espaces, normaliser en .ext
-            exts = []
-            for tok in ext_text.split():
-                tok = tok.strip().lower()
-                if not tok:
-                    continue
-                if not tok.startswith('.'):
-                    # Certaines entrées peuvent omettre le point
-                    tok = '.' + tok
-                exts.append(tok)
-            # Dédupliquer tout en conservant l'ordre
-            seen = set()
-            norm_exts = []
-            for e in exts:
-                if e not in seen:
-                    seen.add(e)
-                    norm_exts.append(e)
+            # Extensions: minuscules en une fois, split par espaces, normaliser en .ext
+            # (certaines entrées omettent le point) et dédupliquer en conservant l'ordre
+            norm_exts = list(dict.fromkeys(
+                tok if tok.startswith('.') else '.' + tok
+                for tok in ext_text.lower().split()
+            ))
             out.append({'folder': folder, 'extensions': norm_exts})
     # Résumé final affiché ailleurs
         return out
@@ -625,9 +707,7 @@ def generate_extensions_json_from_es_systems():
     # Prioriser RetroBat en tête si présent
     def score(p):
         return 0 if 'templates' in p.replace('\\', '/').lower() else 1
-    for cfg in sorted(paths, key=score):
-        if not os.path.exists(cfg):
-            continue
+    for cfg, _st in sorted(paths, key=lambda entry: score(entry[0])):
         items = _parse_es_systems_cfg(cfg)
         for itm in items:
             folder = itm['folder']
@@ -646,6 +726,17 @@ def generate_extensions_json_from_es_systems():
     logger.info(f"Extensions combinées totales: {len(result)} systèmes")
     return result
     
+# Décision d'extraction forcée par dossier: folder -> (extensions concernées, extraire?)
+# - bios: forcer l'extraction des archives même si le système n'est pas connu
+# - psvita: ne pas extraire les ZIP (les RAR restent extraits puis traités par handle_psvita)
+# - dos: forcer l'extraction des ZIP et RAR pour structurer en dossiers .pc
+_FOLDER_ARCHIVE_POLICY = {
+    "bios": ((".zip", ".rar"), True),
+    "psvita": ((".zip",), False),
+    "dos": ((".zip", ".rar"), True),
+}
+_BIOS_PLATFORMS = frozenset({"BIOS", "- BIOS by TMCTV -", "- BIOS"})
+
 def check_extension_before_download(url, platform, game_name):
     """Vérifie l'extension avant de lancer le téléchargement et retourne un tuple de 4 éléments."""
     try:
@@ -657,38 +748,23 @@ def check_extension_before_download(url, platform, game_name):
             logger.warning(f"Fichier {config.JSON_EXTENSIONS} vide ou introuvable; poursuite avec extensions inconnues")
             extensions_data = []
 
-        is_supported = is_extension_supported(sanitized_name, platform, extensions_data)
         extension = os.path.splitext(sanitized_name)[1].lower()
         is_archive = extension in (".zip", ".rar")
 
-        # Déterminer si le système (dossier) est connu dans extensions_data
+        # Déterminer si le système (dossier) est connu dans extensions_data (lookup O(1) via l'index)
         dest_folder_name = _get_dest_folder_name(platform)
-        system_known = any(s.get("folder") == dest_folder_name for s in extensions_data)
+        ext_set = get_extensions_index().get(dest_folder_name)
+        system_known = ext_set is not None
+        is_supported = system_known and extension in ext_set
 
-        # Traitement spécifique BIOS: forcer extraction des archives même si le système n'est pas connu
-        try:
-            bios_like = {"BIOS", "- BIOS by TMCTV -", "- BIOS"}
-            if (dest_folder_name == "bios" or platform in bios_like) and is_archive:
-                logger.debug(f"Plateforme BIOS détectée pour {sanitized_name}, extraction auto forcée pour {extension}")
-                return (url, platform, game_name, True)
-        except Exception:
-            pass
-
-        # Traitement spécifique PS Vita: ne pas extraire les archives ZIP même si non supportées
-        try:
-            if dest_folder_name == "psvita" and extension == ".zip":
-                logger.debug(f"Plateforme PS Vita détectée pour {sanitized_name}, pas d'extraction automatique pour {extension}")
-                return (url, platform, game_name, False)
-        except Exception:
-            pass
-
-        # Traitement spécifique DOS: forcer extraction des ZIP et RAR pour structurer en dossiers .pc
-        try:
-            if dest_folder_name == "dos" and is_archive:
-                logger.debug(f"Plateforme DOS détectée pour {sanitized_name}, extraction forcée pour {extension}")
-                return (url, platform, game_name, True)
-        except Exception:
-            pass
+        # Traitements spécifiques par dossier (BIOS, PS Vita, DOS): décision d'extraction fixe
+        if platform in _BIOS_PLATFORMS and is_archive:
+            logger.debug("Plateforme BIOS détectée pour %s, extraction auto forcée pour %s", sanitized_name, extension)
+            return (url, platform, game_name, True)
+        policy = _FOLDER_ARCHIVE_POLICY.get(dest_folder_name)
+        if policy is not None and extension in policy[0]:
+            logger.debug("Plateforme %s détectée pour %s, extraction automatique: %s", dest_folder_name, sanitized_name, policy[1])
+            return (url, platform, game_name, policy[1])
 
         if is_supported:
             logger.debug(f"L'extension de {sanitized_name} est supportée pour {platform}")
@@ -720,127 +796,160 @@ def is_extension_supported(filename, platform_key, extensions_data):
     """Vérifie si l'extension du fichier est supportée pour la plateforme donnée.
     platform_key correspond maintenant à l'identifiant utilisé dans config.platforms (platform_name)."""
     extension = os.path.splitext(filename)[1].lower()
-
-    dest_dir = None
-    for platform_dict in config.platform_dicts:
-        # Nouveau schéma: platform_name
-        if platform_dict.get("platform_name") == platform_key:
-            dest_dir = os.path.join(config.ROMS_FOLDER, platform_dict.get("folder"))
-            break
-
-    if not dest_dir:
-        logger.warning(f"Aucun dossier 'folder' trouvé pour la plateforme {platform_key}")
-        dest_dir = os.path.join(os.path.dirname(os.path.dirname(config.APP_FOLDER)), platform_key)
-    
-    dest_folder_name = os.path.basename(dest_dir)
-    logger.debug(f"Vérification extension {extension} pour {filename} dans dossier {dest_folder_name}, {len(extensions_data)} systèmes disponibles")
-    
-    for i, system in enumerate(extensions_data):
-        if system["folder"] == dest_folder_name:
-            result = extension in system["extensions"]
-            logger.debug(f"Système trouvé: {dest_folder_name}, extensions: {system['extensions']}, résultat: {result}")
-            return result
-    
-    logger.warning(f"Aucun système trouvé pour le dossier {dest_dir}")
-    return False
+    if extensions_data is _extensions_cache:
+        # Données courantes: une recherche dans _platform_ext_sets, sans log
+        try:
+            ext_set = _platform_ext_sets[platform_key]
+        except KeyError:
+            ext_set = _platform_ext_sets[platform_key] = _resolve_platform_ext_set(platform_key, get_extensions_index())
+    else:
+        if _foreign_extensions_index["data"] is not extensions_data:
+            _foreign_extensions_index["index"] = _build_extensions_index(extensions_data)
+            _foreign_extensions_index["data"] = extensions_data
+        ext_set = _resolve_platform_ext_set(platform_key, _foreign_extensions_index["index"])
+    return ext_set is not None and extension in ext_set
+
+
+def _resolve_platform_ext_set(platform_key, index):
+    """Extensions du dossier de destination de platform_key dans index, ou None (avertissements journalisés)."""
+    if platform_key not in config.dest_folder_by_platform:
+        logger.warning("Aucun dossier 'folder' trouvé pour la plateforme %s", platform_key)
+    dest_folder_name = _get_dest_folder_name(platform_key)
+    ext_set = index.get(dest_folder_name)
+    if ext_set is None:
+        logger.warning("Aucun système trouvé pour le dossier %s", dest_folder_name)
+    elif logger.isEnabledFor(logging.DEBUG):
+        logger.debug("Système trouvé pour %s: %s, extensions: %s", platform_key, dest_folder_name, sorted(ext_set))
+    return ext_set
 
 
 def _get_dest_folder_name(platform_key: str) -> str:
     """Retourne le nom du dossier de destination pour une plateforme (basename du dossier)."""
-    dest_dir = None
-    for platform_dict in config.platform_dicts:
-        if platform_dict.get("platform_name") == platform_key:
-            folder = platform_dict.get("folder")
-            if folder:
-                dest_dir = os.path.join(config.ROMS_FOLDER, folder)
-            break
-    if not dest_dir:
-        dest_dir = os.path.join(os.path.dirname(os.path.dirname(config.APP_FOLDER)), platform_key)
-    return os.path.basename(dest_dir)
+    folder_name = config.dest_folder_by_platform.get(platform_key)
+    if folder_name:
+        return folder_name
+    return os.path.basename(os.path.join(os.path.dirname(os.path.dirname(config.APP_FOLDER)), platform_key))
+
+
+
 
+# Cache du résultat disque de load_sources, invalidé par le mtime de systems_list.json et du dossier games
+_sources_cache = {"key": None, "value": None, "sorted_names": None}
+
+
+def _stat_key(path):
+    """Clé de fraîcheur (mtime_ns, taille) d'un chemin, ou None s'il est absent."""
+    try:
+        st = os.stat(path)
+        return (st.st_mtime_ns, st.st_size)
+    except (OSError, TypeError):
+        return None
+
+
+def _load_sources_from_disk():
+    """Lit systems_list.json et le fusionne avec les fichiers présents dans GAMES_FOLDER (ajouts/suppressions persistés)."""
+    sources = []
+    if os.path.exists(config.SOURCES_FILE):
+        with open(config.SOURCES_FILE, 'r', encoding='utf-8') as f:
+            sources = json.load(f)
+        if not isinstance(sources, list):
+            logger.error("systems_list.json n'est pas une liste JSON valide")
+            sources = []
+    else:
+        logger.warning(f"Fichier systems_list absent: {config.SOURCES_FILE}")
+
+    # S'assurer que chaque entrée possède la clé platform_image (vide si absente)
+    for s in sources:
+        if "platform_image" not in s:
+            # Supporter ancienne clé system_image -> platform_image si présente
+            legacy = s.pop("system_image", "") if isinstance(s, dict) else ""
+            s["platform_image"] = legacy or ""
+        # Normaliser clé dossier -> folder si besoin (legacy francophone)
+        if isinstance(s, dict) and "folder" not in s:
+            legacy_folder = s.get("dossier") or s.get("folder_name")
+            if legacy_folder:
+                s["folder"] = legacy_folder
+
+    # Un seul parcours du dossier games, réutilisé pour les ajouts et les suppressions
+    json_names = []
+    try:
+        with os.scandir(config.GAMES_FOLDER) as it:
+            json_names = sorted(e.name for e in it if e.name.lower().endswith('.json'))
+    except OSError:
+        pass
 
+    existing_names = {s.get("platform_name", "") for s in sources}
+    added = []
+    if json_names:
+        for fname in json_names:
+            pname = os.path.splitext(fname)[0]
+            if not pname or pname in existing_names:
+                continue
+            new_entry = {"platform_name": pname, "folder": pname, "platform_image": ""}
+            sources.append(new_entry)
+            added.append(pname)
+            existing_names.add(pname)
+
+    # Déterminer les plateformes orphelines (fichier manquant)
+    existing_files = {os.path.splitext(f)[0] for f in json_names}
+    removed = []
+    filtered_sources = []
+    for entry in sources:
+        pname = entry.get("platform_name", "")
+        # Garder seulement si un fichier existe
+        if pname in existing_files:
+            filtered_sources.append(entry)
+        else:
+            # Ne retirer que si ce n'est pas un nom vide
+            if pname:
+                removed.append(pname)
+    sources = filtered_sources
+
+    if added:
+        logger.info(f"Plateformes ajoutées automatiquement: {', '.join(added)}")
+    if removed:
+        logger.info(f"Plateformes supprimées (fichiers absents): {', '.join(removed)}")
+
+    # Persister si modifications (ajouts ou suppressions)
+    if added or removed:
+        try:
+            # Pas de tri avant persistance: conserver ordre d'origine + ajouts fins
+            os.makedirs(os.path.dirname(config.SOURCES_FILE), exist_ok=True)
+            with open(config.SOURCES_FILE, 'w', encoding='utf-8') as f:
+                json.dump(sources, f, ensure_ascii=False, indent=2)
+            logger.info("systems_list.json mis à jour (ajouts/suppressions, ordre conservé)")
+        except Exception as e:
+            logger.error(f"Échec écriture systems_list.json après maj auto: {e}")
 
+    return sources
 
 # Fonction pour charger sources.json
 def load_sources():
     try:
-        sources = []
-        if os.path.exists(config.SOURCES_FILE):
-            with open(config.SOURCES_FILE, 'r', encoding='utf-8') as f:
-                sources = json.load(f)
-            if not isinstance(sources, list):
-                logger.error("systems_list.json n'est pas une liste JSON valide")
-                sources = []
+        # Partie disque (lecture JSON + scan du dossier games) réutilisée tant que rien n'a changé sur le disque
+        cache_key = (_stat_key(config.SOURCES_FILE), _stat_key(config.GAMES_FOLDER))
+        if _sources_cache["value"] is not None and _sources_cache["key"] == cache_key:
+            sources = _sources_cache["value"]
+            all_sorted_names = _sources_cache["sorted_names"]
         else:
-            logger.warning(f"Fichier systems_list absent: {config.SOURCES_FILE}")
-
-        # S'assurer que chaque entrée possède la clé platform_image (vide si absente)
-        for s in sources:
-            if "platform_image" not in s:
-                # Supporter ancienne clé system_image -> platform_image si présente
-                legacy = s.pop("system_image", "") if isinstance(s, dict) else ""
-                s["platform_image"] = legacy or ""
-            # Normaliser clé dossier -> folder si besoin (legacy francophone)
-            if isinstance(s, dict) and "folder" not in s:
-                legacy_folder = s.get("dossier") or s.get("folder_name")
-                if legacy_folder:
-                    s["folder"] = legacy_folder
-
-        existing_names = {s.get("platform_name", "") for s in sources}
-        added = []
-        if os.path.isdir(config.GAMES_FOLDER):
-            for fname in sorted(os.listdir(config.GAMES_FOLDER)):
-                if not fname.lower().endswith('.json'):
-                    continue
-                pname = os.path.splitext(fname)[0]
-                if not pname or pname in existing_names:
-                    continue
-                new_entry = {"platform_name": pname, "folder": pname, "platform_image": ""}
-                sources.append(new_entry)
-                added.append(pname)
-                existing_names.add(pname)
-
-        # Déterminer les plateformes orphelines (fichier manquant)
-        existing_files = set()
-        if os.path.isdir(config.GAMES_FOLDER):
-            existing_files = {os.path.splitext(f)[0] for f in os.listdir(config.GAMES_FOLDER) if f.lower().endswith('.json')}
-        removed = []
-        filtered_sources = []
-        for entry in sources:
-            pname = entry.get("platform_name", "")
-            # Garder seulement si un fichier existe
-            if pname in existing_files:
-                filtered_sources.append(entry)
-            else:
-                # Ne retirer que si ce n'est pas un nom vide
-                if pname:
-                    removed.append(pname)
-        sources = filtered_sources
-
-        if added:
-            logger.info(f"Plateformes ajoutées automatiquement: {', '.join(added)}")
-        if removed:
-            logger.info(f"Plateformes supprimées (fichiers absents): {', '.join(removed)}")
-
-        # Persister si modifications (ajouts ou suppressions)
-        if added or removed:
-            try:
-                # Pas de tri avant persistance: conserver ordre d'origine + ajouts fins
-                os.makedirs(os.path.dirname(config.SOURCES_FILE), exist_ok=True)
-                with open(config.SOURCES_FILE, 'w', encoding='utf-8') as f:
-                    json.dump(sources, f, ensure_ascii=False, indent=2)
-                logger.info("systems_list.json mis à jour (ajouts/suppressions, ordre conservé)")
-            except Exception as e:
-                logger.error(f"Échec écriture systems_list.json après maj auto: {e}")
-
-        # Pour l'affichage on veut un tri alphabétique sans toucher l'ordre de persistance
-        sorted_for_display = sorted(sources, key=lambda x: x.get("platform_name", "").lower())
+            sources = _load_sources_from_disk()
+            # Fichiers de jeux ajoutés/supprimés: oublier les résolutions et listes en cache
+            invalidate_game_file_cache()
+            # systems_list.json relu: platform_image a pu changer
+            invalidate_system_image_cache()
+            # Pour l'affichage on veut un tri alphabétique sans toucher l'ordre de persistance
+            # (calculé une seule fois par contenu, réutilisé tant que le cache est valide)
+            sorted_for_display = sorted(sources, key=lambda x: x.get("platform_name", "").lower())
+            all_sorted_names = [s.get("platform_name", "") for s in sorted_for_display]
+            # Re-stat: la persistance éventuelle vient de réécrire systems_list.json
+            _sources_cache["key"] = (_stat_key(config.SOURCES_FILE), _stat_key(config.GAMES_FOLDER))
+            _sources_cache["value"] = sources
+            _sources_cache["sorted_names"] = all_sorted_names
 
         # Construire structures config: platform_dicts = ordre fichier, platforms = tri (avec filtre masqués)
         config.platform_dicts = sources  # ordre brut fichier
         settings = load_rgsx_settings()
         hidden = set(settings.get("hidden_platforms", [])) if isinstance(settings, dict) else set()
-        all_sorted_names = [s.get("platform_name", "") for s in sorted_for_display]
         visible_names = [n for n in all_sorted_names if n and n not in hidden]
 
         # Masquer automatiquement les systèmes dont le dossier ROM n'existe pas (selon le toggle)
@@ -855,6 +964,13 @@ def load_sources():
             
             if not webapp_mode:
                 sources_by_name = {s.get("platform_name", ""): s for s in sources if isinstance(s, dict)}
+                # Dossiers ROM présents, en un seul parcours (au lieu d'un stat par plateforme)
+                rom_dirs = set()
+                try:
+                    with os.scandir(config.ROMS_FOLDER) as it:
+                        rom_dirs = {e.name for e in it if e.is_dir()}
+                except OSError:
+                    pass
                 for name in list(visible_names):
                     entry = sources_by_name.get(name) or {}
                     folder = entry.get("folder")
@@ -862,6 +978,9 @@ def load_sources():
                     bios_name = name.strip()
                     if not folder or bios_name == "- BIOS by TMCTV -" or bios_name == "- BIOS":
                         continue
+                    if folder in rom_dirs:
+                        continue
+                    # Repli stat: sous-dossiers ("a/b") et systèmes de fichiers insensibles à la casse
                     expected_dir = os.path.join(config.ROMS_FOLDER, folder)
                     if not os.path.isdir(expected_dir):
                         unsupported.append(name)
@@ -886,90 +1005,296 @@ def load_sources():
         config.platform_names = {p: p for p in config.platforms}
         # Nouveau mapping par nom pour éviter décalages index après tri d'affichage
         try:
-            config.platform_dict_by_name = {d.get("platform_name", ""): d for d in config.platform_dicts}
+            # Première entrée prioritaire (comme l'ancien parcours linéaire de platform_dicts)
+            by_name = {}
+            dest_folders = {}
+            for d in config.platform_dicts:
+                pname = d.get("platform_name", "")
+                if pname in by_name:
+                    continue
+                by_name[pname] = d
+                folder = d.get("folder")
+                if folder:
+                    dest_folders[pname] = os.path.basename(os.path.join(config.ROMS_FOLDER, folder))
+            config.platform_dict_by_name = by_name
+            config.dest_folder_by_platform = dest_folders
+            _platform_ext_sets.clear()
         except Exception:
             config.platform_dict_by_name = {}
-        config.games_count = {}
-        for platform_name in config.platforms:
-            games = load_games(platform_name)
-            config.games_count[platform_name] = len(games)
+            config.dest_folder_by_platform = {}
+            _platform_ext_sets.clear()
+        # Comptage paresseux: le fichier d'une plateforme n'est lu qu'au premier accès à son compteur
+        config.games_count = _LazyGamesCount(config.platforms)
         return sources
     except Exception as e:
         logger.error(f"Erreur fusion systèmes + détection jeux: {e}")
         return []
 
-def load_games(platform_id):
+def _game_file_candidates(platform_id):
+    """Chemins candidats du fichier de jeux d'une plateforme, par ordre de priorité."""
+    # Retrouver l'objet plateforme pour accéder éventuellement à 'folder'
+    platform_dict = None
+    for pd in config.platform_dicts:
+        if pd.get("platform_name") == platform_id or pd.get("platform") == platform_id:
+            platform_dict = pd
+            break
+
+    candidates = []
+    # 1. Nom exact
+    candidates.append(os.path.join(config.GAMES_FOLDER, f"{platform_id}.json"))
+    # 2. Nom normalisé
+    norm = normalize_platform_name(platform_id)
+    if norm and norm != platform_id:
+        candidates.append(os.path.join(config.GAMES_FOLDER, f"{norm}.json"))
+    # 3. Folder déclaré
+    if platform_dict:
+        folder_name = platform_dict.get("folder")
+        if folder_name:
+            candidates.append(os.path.join(config.GAMES_FOLDER, f"{folder_name}.json"))
+    return candidates
+
+@functools.lru_cache(maxsize=128)
+def _resolve_game_file(platform_id):
+    """Retourne le premier fichier de jeux existant pour la plateforme, ou None.
+    Mis en cache: voir invalidate_game_file_cache()."""
+    for c in _game_file_candidates(platform_id):
+        if os.path.exists(c):
+            return c
+    return None
+
+# {platform_id: (fichier, (mtime_ns, taille), nombre de jeux)}
+_games_count_cache = {}
+
+def _count_games(platform_id):
+    """Nombre de jeux d'une plateforme; le fichier n'est reparsé que si son mtime/taille a changé."""
+    game_file = _resolve_game_file(platform_id)
+    key = _stat_key(game_file) if game_file else None
+    cached = _games_count_cache.get(platform_id)
+    if cached is not None and key is not None and cached[0] == game_file and cached[1] == key:
+        return cached[2]
+    count = count_games(platform_id, game_file)
+    if key is not None:
+        _games_count_cache[platform_id] = (game_file, key, count)
+    return count
+
+def _is_countable_game(item):
+    """Même règle que la normalisation de load_games: l'élément produit-il une entrée de jeu ?"""
+    if isinstance(item, (list, tuple)):
+        return len(item) > 0
+    if isinstance(item, dict):
+        return bool(item.get('game_name') or item.get('name') or item.get('title') or item.get('game'))
+    return True
+
+def count_games(platform_id, game_file=None):
+    """Compte les jeux d'une plateforme sans construire la liste normalisée.
+    Avec ijson, un fichier tableau ([...] ou {"games": [...]}) est parcouru en flux; sinon repli sur load_games."""
+    if ijson is not None:
+        game_file = game_file or _resolve_game_file(platform_id)
+        if game_file:
+            counter = [0]
+
+            def count_item(item):
+                if _is_countable_game(item):
+                    counter[0] += 1
+
+            if _stream_games_items(game_file, count_item, min_size=0):
+                return counter[0]
+    return len(load_games(platform_id))
+
+class _LazyGamesCount(dict):
+    """config.games_count paresseux: le compteur d'une plateforme visible est calculé au premier accès.
+    Les plateformes non listées se comportent comme avant (absentes du dict)."""
+
+    def __init__(self, platforms):
+        super().__init__()
+        self._platforms = set(platforms)
+
+    def __missing__(self, platform_id):
+        if platform_id not in self._platforms:
+            raise KeyError(platform_id)
+        value = _count_games(platform_id)
+        self[platform_id] = value
+        return value
+
+    def __contains__(self, platform_id):
+        return dict.__contains__(self, platform_id) or platform_id in self._platforms
+
+    def get(self, platform_id, default=None):
+        if platform_id in self:
+            return self[platform_id]
+        return default
+
+# En dessous de cette taille, json.load reste plus rapide que l'analyse en flux
+_STREAM_GAMES_MIN_SIZE = 256 * 1024
+
+def _stream_games_items(game_file, on_item, min_size=_STREAM_GAMES_MIN_SIZE):
+    """Parcourt en flux (ijson) les jeux d'un fichier [...] ou {"games": [...]} en appelant on_item(item).
+    Retourne False si le fichier fait moins de min_size octets, est d'une autre forme, sans jeu ou illisible en flux
+    (l'appelant utilise alors json.load)."""
     try:
-        # Retrouver l'objet plateforme pour accéder éventuellement à 'folder'
-        platform_dict = None
-        for pd in config.platform_dicts:
-            if pd.get("platform_name") == platform_id or pd.get("platform") == platform_id:
-                platform_dict = pd
-                break
+        if min_size and os.path.getsize(game_file) < min_size:
+            return False
+        with open(game_file, 'rb') as f:
+            head = f.read(64).lstrip()
+            f.seek(0)
+            if head.startswith(b'['):
+                prefix = 'item'
+            elif head.startswith(b'{'):
+                prefix = 'games.item'
+            else:
+                return False
+            found = False
+            for item in ijson.items(f, prefix, use_float=True):
+                found = True
+                on_item(item)
+            return found
+    except Exception as e:
+        logger.debug("Lecture en flux impossible pour %s, repli sur json.load: %s", game_file, e)
+        return False
 
-        candidates = []
-        # 1. Nom exact
-        candidates.append(os.path.join(config.GAMES_FOLDER, f"{platform_id}.json"))
-        # 2. Nom normalisé
-        norm = normalize_platform_name(platform_id)
-        if norm and norm != platform_id:
-            candidates.append(os.path.join(config.GAMES_FOLDER, f"{norm}.json"))
-        # 3. Folder déclaré
-        if platform_dict:
-            folder_name = platform_dict.get("folder")
-            if folder_name:
-                candidates.append(os.path.join(config.GAMES_FOLDER, f"{folder_name}.json"))
-
-        game_file = None
-        for c in candidates:
-            if os.path.exists(c):
-                game_file = c
-                break
-        if not game_file:
-            logger.warning(f"Aucun fichier de jeux trouvé pour {platform_id} (candidats: {candidates})")
-            return []
+# {platform_id: (fichier, (mtime_ns, taille), liste normalisée)}: évite de reparser un fichier inchangé.
+# LRU limité aux dernières plateformes ouvertes, pour ne pas garder en mémoire toutes les listes de la session
+_GAMES_CACHE_SIZE = 3
+_games_cache = collections.OrderedDict()
+_games_cache_lock = threading.Lock()
 
-        with open(game_file, 'r', encoding='utf-8') as f:
-            data = json.load(f)
+def invalidate_game_file_cache():
+    """Oublie les fichiers de jeux résolus et les listes chargées (re-scan des plateformes ou mise à jour des données)."""
+    _resolve_game_file.cache_clear()
+    with _games_cache_lock:
+        _games_cache.clear()
 
-        # Si dict avec clé 'games'
-        if isinstance(data, dict) and 'games' in data:
-            data = data['games']
+def load_games(platform_id):
+    try:
+        game_file = _resolve_game_file(platform_id)
+        key = _stat_key(game_file) if game_file else None
+        if game_file and key is None:
+            # Fichier disparu depuis la résolution mise en cache: nouvelle résolution
+            _resolve_game_file.cache_clear()
+            game_file = _resolve_game_file(platform_id)
+            key = _stat_key(game_file) if game_file else None
+        if not game_file:
+            logger.warning(f"Aucun fichier de jeux trouvé pour {platform_id} (candidats: {_game_file_candidates(platform_id)})")
+            return []
 
-        normalized = []  # (name, url, size)
+        with _games_cache_lock:
+            cached = _games_cache.get(platform_id)
+            if cached is not None and cached[0] == game_file and cached[1] == key:
+                _games_cache.move_to_end(platform_id)
+                return list(cached[2])
+        normalized = _parse_games_file(platform_id, game_file)
+        if key is not None:
+            with _games_cache_lock:
+                _games_cache[platform_id] = (game_file, key, normalized)
+                _games_cache.move_to_end(platform_id)
+                while len(_games_cache) > _GAMES_CACHE_SIZE:
+                    _games_cache.popitem(last=False)
+        # Copie: l'appelant peut modifier la liste sans altérer le cache
+        return list(normalized)
+    except Exception as e:
+        logger.error(f"Erreur lors du chargement des jeux pour {platform_id}: {e}")
+        return []
 
-        def extract_from_dict(d):
-            name = d.get('game_name') or d.get('name') or d.get('title') or d.get('game')
-            url = d.get('url') or d.get('download') or d.get('link') or d.get('href')
-            size = d.get('size') or d.get('filesize') or d.get('length')
-            if name:
-                normalized.append((str(name), url if isinstance(url, str) and url.strip() else None, str(size) if size else None))
+# Clés reconnues pour un jeu décrit par un dict, par ordre de priorité
+_GAME_NAME_KEYS = ('game_name', 'name', 'title', 'game')
+_GAME_URL_KEYS = ('url', 'download', 'link', 'href')
+_GAME_SIZE_KEYS = ('size', 'filesize', 'length')
+
+def _dict_game_schema(sample):
+    """Schéma d'un dict de jeu exemple (premier jeu du fichier): (clés, clé name, clé url, clé size), ou None sans clé de nom.
+    Pour un dict ayant exactement ces clés et des valeurs non vides, la clé retenue est celle que choisirait
+    la chaîne de repli générique (première clé présente dans l'ordre de priorité)."""
+    keys = frozenset(sample)
+    name_key = next((k for k in _GAME_NAME_KEYS if k in keys), None)
+    if name_key is None:
+        return None
+    url_key = next((k for k in _GAME_URL_KEYS if k in keys), None)
+    size_key = next((k for k in _GAME_SIZE_KEYS if k in keys), None)
+    return keys, name_key, url_key, size_key
+
+def _parse_games_file(platform_id, game_file):
+    """Lit un fichier de jeux et le normalise en liste de tuples (name, url, size)."""
+    normalized = []  # (name, url, size)
+
+    def extract_from_dict(d):
+        name = d.get('game_name') or d.get('name') or d.get('title') or d.get('game')
+        url = d.get('url') or d.get('download') or d.get('link') or d.get('href')
+        size = d.get('size') or d.get('filesize') or d.get('length')
+        if name:
+            normalized.append((str(name), url if isinstance(url, str) and url.strip() else None, str(size) if size else None))
+
+    def add_item(item):
+        if isinstance(item, (list, tuple)):
+            if len(item) == 0:
+                return
+            name = str(item[0])
+            url = item[1] if len(item) > 1 and isinstance(item[1], str) and item[1].strip() else None
+            size = item[2] if len(item) > 2 and isinstance(item[2], str) and item[2].strip() else None
+            normalized.append((name, url, size))
+        elif isinstance(item, dict):
+            extract_from_dict(item)
+        elif isinstance(item, str):
+            normalized.append((item, None, None))
+        else:
+            normalized.append((str(item), None, None))
 
-        if isinstance(data, list):
+    # Gros fichiers: lecture en flux avec ijson (pas de liste complète en mémoire)
+    if ijson is not None and _stream_games_items(game_file, add_item):
+        logger.debug("%s: %d jeux (flux)", os.path.basename(game_file), len(normalized))
+        return normalized
+    normalized.clear()
+
+    with open(game_file, 'r', encoding='utf-8') as f:
+        data = json.load(f)
+
+    # Si dict avec clé 'games'
+    if isinstance(data, dict) and 'games' in data:
+        data = data['games']
+
+    if isinstance(data, list):
+        schema = _dict_game_schema(data[0]) if data and type(data[0]) is dict else None
+        if schema is not None:
+            # Chemin spécialisé sur le schéma du premier jeu: un accès direct par champ;
+            # tout élément qui s'en écarte (autres clés, valeur vide) passe par le chemin générique
+            keys, name_key, url_key, size_key = schema
+            append = normalized.append
             for item in data:
-                if isinstance(item, (list, tuple)):
-                    if len(item) == 0:
+                if type(item) is dict and item.keys() == keys:
+                    name = item[name_key]
+                    url = item[url_key] if url_key else None
+                    size = item[size_key] if size_key else None
+                    if name and (url or not url_key) and (size or not size_key):
+                        append((str(name), url if isinstance(url, str) and url.strip() else None, str(size) if size else None))
                         continue
-                    name = str(item[0])
-                    url = item[1] if len(item) > 1 and isinstance(item[1], str) and item[1].strip() else None
-                    size = item[2] if len(item) > 2 and isinstance(item[2], str) and item[2].strip() else None
-                    normalized.append((name, url, size))
-                elif isinstance(item, dict):
-                    extract_from_dict(item)
-                elif isinstance(item, str):
-                    normalized.append((item, None, None))
-                else:
-                    normalized.append((str(item), None, None))
-        elif isinstance(data, dict):  # dict sans 'games'
-            extract_from_dict(data)
+                add_item(item)
         else:
-            logger.warning(f"Format de fichier jeux inattendu pour {platform_id}: {type(data)}")
-
-        logger.debug(f"{os.path.basename(game_file)}: {len(normalized)} jeux")
-        return normalized
-    except Exception as e:
-        logger.error(f"Erreur lors du chargement des jeux pour {platform_id}: {e}")
-        return []
+            for item in data:
+                add_item(item)
+    elif isinstance(data, dict):  # dict sans 'games'
+        extract_from_dict(data)
+    else:
+        logger.warning(f"Format de fichier jeux inattendu pour {platform_id}: {type(data)}")
+
+    logger.debug("%s: %d jeux", os.path.basename(game_file), len(normalized))
+    return normalized
+
+_char_width_cache = {}  # {(font, ch): largeur}, vidé quand config.font_generation change
+_char_width_generation = None
+_CHAR_WIDTH_CACHE_MAX = 8192
+
+def _char_width(font, ch):
+    """Largeur (px) d'un caractère pour une police donnée, mise en cache.
+    Le cache est vidé à chaque rechargement des polices pour ne pas retenir les anciens objets Font."""
+    global _char_width_generation
+    if _char_width_generation != config.font_generation or len(_char_width_cache) >= _CHAR_WIDTH_CACHE_MAX:
+        _char_width_cache.clear()
+        _char_width_generation = config.font_generation
+    key = (font, ch)
+    width = _char_width_cache.get(key)
+    if width is None:
+        width = font.size(ch)[0]
+        _char_width_cache[key] = width
+    return width
 
 def truncate_text_middle(text, font, max_width, is_filename=True):
     """Tronque le texte en insérant '...' au milieu, en préservant le début et la fin.
@@ -987,10 +1312,13 @@ def truncate_text_middle(text, font, max_width, is_filename=True):
         return ellipsis
 
     # Diviser la largeur disponible entre début et fin, en priorisant la fin
+    # Largeurs calculées incrémentalement (somme des largeurs de caractères en cache)
     chars = list(text)
     left = []
-    right = []
-    left_width = 0
+    right = collections.deque()  # appendleft/popleft en O(1)
+    left_sum = 0  # largeur réelle de left
+    right_sum = 0  # largeur réelle de right
+    left_width = 0  # inclut le caractère refusé en cas de dépassement
     right_width = 0
     left_idx = 0
     right_idx = len(chars) - 1
@@ -999,28 +1327,30 @@ def truncate_text_middle(text, font, max_width, is_filename=True):
     while left_idx <= right_idx and (left_width + right_width) < max_text_width:
         # Ajouter à droite en priorité
         if left_idx <= right_idx:
-            right.insert(0, chars[right_idx])
-            right_width = font.size(''.join(right))[0]
+            ch = chars[right_idx]
+            right_width = right_sum + _char_width(font, ch)
             if left_width + right_width > max_text_width:
-                right.pop(0)
                 break
+            right.appendleft(ch)
+            right_sum = right_width
             right_idx -= 1
         # Ajouter à gauche seulement si nécessaire
         if left_idx < right_idx:
-            left.append(chars[left_idx])
-            left_width = font.size(''.join(left))[0]
+            ch = chars[left_idx]
+            left_width = left_sum + _char_width(font, ch)
             if left_width + right_width > max_text_width:
-                left.pop()
                 break
+            left.append(ch)
+            left_sum = left_width
             left_idx += 1
 
     # Reculer jusqu'à un espace pour éviter de couper un mot
     while left and left[-1] != ' ' and left_width + right_width > max_text_width:
-        left.pop()
-        left_width = font.size(''.join(left))[0] if left else 0
+        left_sum -= _char_width(font, left.pop())
+        left_width = left_sum if left else 0
     while right and right[0] != ' ' and left_width + right_width > max_text_width:
-        right.pop(0)
-        right_width = font.size(''.join(right))[0] if right else 0
+        right_sum -= _char_width(font, right.popleft())
+        right_width = right_sum if right else 0
 
     return ''.join(left).rstrip() + ellipsis + ''.join(right).lstrip()
 
@@ -1045,9 +1375,12 @@ def truncate_text_end(text, font, max_width):
         logger.error(f"Erreur lors du rendu du texte '{text}': {str(e)}")
         return text  # Retourne le texte brut en cas d'erreur
 
+# Table de traduction des caractères interdits dans les noms de fichiers
+_SANITIZE_TABLE = str.maketrans({c: '_' for c in '<>:"/\\|?*'})
+
 def sanitize_filename(name):
     """Sanitise les noms de fichiers en remplaçant les caractères interdits."""
-    return re.sub(r'[<>:"/\/\\|?*]', '_', name).strip()
+    return name.translate(_SANITIZE_TABLE).strip()
     
 def wrap_text(text, font, max_width):
     """Divise le texte en lignes pour respecter la largeur maximale, en coupant les mots longs si nécessaire."""
@@ -1060,23 +1393,27 @@ def wrap_text(text, font, max_width):
     
     for word in words:
         # Si le mot seul dépasse max_width, le couper caractère par caractère
-        if font.render(word, True, (255, 255, 255)).get_width() > max_width:
+        if font.size(word)[0] > max_width:
+            # Largeur de ligne tenue à jour caractère par caractère (largeurs en cache)
             temp_line = current_line
+            temp_width = font.size(temp_line)[0] if temp_line else 0
+            space_width = _char_width(font, ' ')
             for char in word:
-                test_line = temp_line + (' ' if temp_line else '') + char
-                test_surface = font.render(test_line, True, (255, 255, 255))
-                if test_surface.get_width() <= max_width:
-                    temp_line = test_line
+                char_width = _char_width(font, char)
+                test_width = temp_width + (space_width if temp_line else 0) + char_width
+                if test_width <= max_width:
+                    temp_line = temp_line + (' ' if temp_line else '') + char
+                    temp_width = test_width
                 else:
                     if temp_line:
                         lines.append(temp_line)
                     temp_line = char
+                    temp_width = char_width
             current_line = temp_line
         else:
             # Comportement standard pour les mots normaux
             test_line = current_line + (' ' if current_line else '') + word
-            test_surface = font.render(test_line, True, (255, 255, 255))
-            if test_surface.get_width() <= max_width:
+            if font.size(test_line)[0] <= max_width:
                 current_line = test_line
             else:
                 if current_line:
@@ -1097,17 +1434,37 @@ def load_system_image(platform_dict):
     5. default.png (dans SAVE_FOLDER/images), sinon default.png de l'app
 
     Cela évite d'échouer lorsque le nom affiché ne correspond pas au fichier image
-    et respecte un mapping explicite fourni par systems_list.json."""
+    et respecte un mapping explicite fourni par systems_list.json.
+    Une image trouvée est mise en cache par (platform_name, folder, platform_image), voir invalidate_system_image_cache().
+    L'absence d'image n'est pas mise en cache: une image ajoutée plus tard est prise en compte."""
     platform_name = platform_dict.get("platform_name", "unknown")
     folder_name = platform_dict.get("folder") or ""
+    platform_image_field = (platform_dict.get("platform_image") or "").strip()
+    key = (platform_name, folder_name, platform_image_field)
+    image = _system_image_cache.get(key)
+    if image is not None:
+        return image
+    try:
+        image = _find_and_load_system_image(platform_name, folder_name, platform_image_field)
+        if image is not None:
+            _system_image_cache[key] = image
+        return image
+    except Exception as e:
+        # Les erreurs ne sont pas mises en cache: nouvelle tentative au prochain appel
+        logger.error(f"Erreur lors du chargement de l'image pour {platform_name} : {str(e)}")
+        return None
+
+# {(platform_name, folder, platform_image): Surface}: une entrée par plateforme affichée
+_system_image_cache = {}
 
+def _find_and_load_system_image(platform_name, folder_name, platform_image_field):
+    """Recherche et charge l'image système (sans cache ni gestion d'erreur, voir load_system_image)."""
     # Dossiers d'images
     save_images = config.IMAGES_FOLDER
     app_images = os.path.join(config.APP_FOLDER, "images")
 
     # Candidats, par ordre de priorité
     candidates = []
-    platform_image_field = (platform_dict.get("platform_image") or "").strip()
     if platform_image_field:
         candidates.append(os.path.join(save_images, platform_image_field))
     candidates.append(os.path.join(save_images, f"{platform_name}.png"))
@@ -1122,42 +1479,47 @@ def load_system_image(platform_dict):
         candidates.append(os.path.join(app_images, f"{folder_name}.png"))
 
     # Charger le premier fichier existant
-    try:
-        for path in candidates:
-            if path and os.path.exists(path):
-                return pygame.image.load(path).convert_alpha()
-
-        # default.png (save d'abord, sinon app)
-        default_save = os.path.join(save_images, "default.png")
-        if os.path.exists(default_save):
-            return pygame.image.load(default_save).convert_alpha()
-        default_app = os.path.join(app_images, "default.png")
-        if os.path.exists(default_app):
-            return pygame.image.load(default_app).convert_alpha()
-
-        logger.error(
-            f"Aucune image trouvée pour {platform_name}. Candidats: "
-            + ", ".join(candidates)
-            + f"; default cherchés: {default_save}, {default_app}"
-        )
-        return None
-    except Exception as e:
-        logger.error(f"Erreur lors du chargement de l'image pour {platform_name} : {str(e)}")
-        return None
+    for path in candidates:
+        if path and os.path.exists(path):
+            return pygame.image.load(path).convert_alpha()
+
+    # default.png (save d'abord, sinon app)
+    default_save = os.path.join(save_images, "default.png")
+    if os.path.exists(default_save):
+        return pygame.image.load(default_save).convert_alpha()
+    default_app = os.path.join(app_images, "default.png")
+    if os.path.exists(default_app):
+        return pygame.image.load(default_app).convert_alpha()
+
+    logger.error(
+        f"Aucune image trouvée pour {platform_name}. Candidats: "
+        + ", ".join(candidates)
+        + f"; default cherchés: {default_save}, {default_app}"
+    )
+    return None
+
+def invalidate_system_image_cache():
+    """Vide le cache des images système (à appeler après mise à jour des images ou changement de platform_image).
+    Incrémente aussi config.system_images_version pour que l'affichage vide son cache d'images redimensionnées."""
+    _system_image_cache.clear()
+    config.system_images_version += 1
 
 def extract_data(zip_path, dest_dir, url):
     """Extrait le contenu de ZIP de DATA dans le dossier config.SAVE_FOLDER sans progression a l'ecran"""
-    logger.debug(f"Extraction de {zip_path} dans {dest_dir}")
+    logger.debug("Extraction de %s dans %s", zip_path, dest_dir)
     try:
         with zipfile.ZipFile(zip_path, 'r') as zip_ref:
             zip_ref.testzip()  # Vérifier l'intégrité de l'archive
-            for info in zip_ref.infolist():
-                if info.is_dir():
-                    continue
-                file_path = os.path.join(dest_dir, info.filename)
-                os.makedirs(os.path.dirname(file_path), exist_ok=True)
+            members = [(info, os.path.join(dest_dir, info.filename)) for info in zip_ref.infolist() if not info.is_dir()]
+            # Un seul makedirs par dossier parent distinct (et non par fichier)
+            for parent in {os.path.dirname(file_path) for _info, file_path in members}:
+                os.makedirs(parent, exist_ok=True)
+            for info, file_path in members:
                 with zip_ref.open(info) as source, open(file_path, 'wb') as dest:
-                    shutil.copyfileobj(source, dest)
+                    shutil.copyfileobj(source, dest, 1 << 20)  # tampon de 1 Mio
+        # Les images système et fichiers de jeux ont pu être mis à jour
+        invalidate_system_image_cache()
+        invalidate_game_file_cache()
         logger.info(f"Extraction terminée de {zip_path}")
         return True, "Extraction terminée avec succès"
     except zipfile.BadZipFile as e:
@@ -1166,27 +1528,108 @@ def extract_data(zip_path, dest_dir, url):
 
     
 
-def _update_extraction_progress(url, extracted_size, total_size, lock, last_save_time_ref, save_interval=0.5):
+# Statuts d'historique d'un téléchargement/extraction en cours
+_ACTIVE_HISTORY_STATUSES = frozenset({"Téléchargement", "Extracting", "Downloading"})
+# Statuts d'une entrée suivie par handle_xbox (en cours + conversion)
+_XBOX_HISTORY_STATUSES = _ACTIVE_HISTORY_STATUSES | {"Converting"}
+
+# {url: (liste historique, longueur, entrée)} : évite de reparcourir config.history à chaque tick de progression
+_progress_entry_cache = {}
+
+def _find_active_history_entry(url):
+    """Retourne l'entrée d'historique en cours pour url (mise en cache tant que config.history n'a pas changé)."""
+    history = config.history
+    cached = _progress_entry_cache.get(url)
+    if cached is not None:
+        cached_list, cached_len, entry = cached
+        if cached_list is history and cached_len == len(history) and entry.get("url") == url and entry.get("status") in _ACTIVE_HISTORY_STATUSES:
+            return entry
+    for entry in history:
+        if entry.get("status") in _ACTIVE_HISTORY_STATUSES and entry.get("url") == url:
+            _progress_entry_cache[url] = (history, len(history), entry)
+            return entry
+    _progress_entry_cache.pop(url, None)
+    return None
+
+# Limitation des mises à jour de progression: au plus une par URL toutes les 0.1s si le pourcentage ne change pas,
+# et une seule sauvegarde de l'historique toutes les 0.5s pour l'ensemble des extractions en cours
+_PROGRESS_MIN_INTERVAL = 0.1
+_HISTORY_SAVE_INTERVAL = 0.5
+# Côté boucles d'extraction: un appel à _update_extraction_progress par Mio écrit (et en fin d'archive)
+_PROGRESS_REPORT_BYTES = 1 << 20
+_progress_last = {}  # {url: (horodatage, pourcentage)}
+# _history_save_state n'est lu et modifié que sous _history_save_lock;
+# les écritures du fichier sont sérialisées par _history_write_lock (jamais deux dumps JSON simultanés)
+_history_save_state = {"last": 0.0, "dirty": False}
+_history_save_lock = threading.Lock()
+_history_write_lock = threading.Lock()
+
+def _mark_history_dirty():
+    """Signale une modification de l'historique, sauvegardée par le prochain vidage."""
+    with _history_save_lock:
+        _history_save_state["dirty"] = True
+
+def _write_history():
+    """Écrit l'historique sur le disque, un seul dump JSON à la fois."""
+    with _history_write_lock:
+        save_history(config.history)
+
+def _flush_history_if_due(current_time):
+    """Sauvegarde l'historique s'il a été modifié et que l'intervalle global est écoulé."""
+    with _history_save_lock:
+        if not _history_save_state["dirty"] or current_time - _history_save_state["last"] < _HISTORY_SAVE_INTERVAL:
+            return
+        _history_save_state["dirty"] = False
+        _history_save_state["last"] = current_time
+    _write_history()
+
+def _flush_pending_history():
+    """Sauvegarde l'historique tout de suite si une modification attend encore le prochain vidage."""
+    with _history_save_lock:
+        if not _history_save_state["dirty"]:
+            return
+        _history_save_state["dirty"] = False
+        _history_save_state["last"] = time.time()
+    _write_history()
+
+def _save_history_now():
+    """Sauvegarde immédiate de l'historique (états terminaux), qui solde toute sauvegarde différée en attente."""
+    with _history_save_lock:
+        _history_save_state["dirty"] = False
+        _history_save_state["last"] = time.time()
+    _write_history()
+
+def _update_extraction_progress(url, extracted_size, total_size, lock):
     """Fonction utilitaire pour mettre à jour la progression d'extraction."""
     try:
         current_time = time.time()
+        progress_percent = int(extracted_size / total_size * 100) if total_size > 0 else 0
+        progress_percent = max(0, min(100, progress_percent))
+        last = _progress_last.get(url)
+        if last is not None and last[1] == progress_percent and current_time - last[0] < _PROGRESS_MIN_INTERVAL:
+            return
         with lock:
             if isinstance(config.history, list):
-                for entry in config.history:
-                    if "status" in entry and entry["status"] in ["Téléchargement", "Extracting", "Downloading"]:
-                        if "url" in entry and entry["url"] == url:
-                            progress_percent = int(extracted_size / total_size * 100) if total_size > 0 else 0
-                            progress_percent = max(0, min(100, progress_percent))
-                            entry["status"] = "Extracting"
-                            entry["progress"] = progress_percent
-                            entry["message"] = "Extraction en cours"
-                            if current_time - last_save_time_ref[0] >= save_interval:
-                                save_history(config.history)
-                                last_save_time_ref[0] = current_time
-                            config.needs_redraw = True
-                            break
+                entry = _find_active_history_entry(url)
+                if entry is not None:
+                    changed = entry.get("progress") != progress_percent or entry.get("status") != "Extracting"
+                    entry["status"] = "Extracting"
+                    entry["progress"] = progress_percent
+                    entry["message"] = "Extraction en cours"
+                    _progress_last[url] = (current_time, progress_percent)
+                    if changed:
+                        _mark_history_dirty()
+                        config.needs_redraw = True
+        _flush_history_if_due(current_time)
     except Exception as e:
-        logger.debug(f"Erreur mise à jour progression extraction: {e}")
+        logger.debug("Erreur mise à jour progression extraction: %s", e)
+
+def _end_extraction_progress(url):
+    """Fin d'une extraction (succès ou échec): oublie l'état de limitation propre à url
+    et écrit l'historique si une mise à jour est encore en attente de sauvegarde."""
+    _progress_last.pop(url, None)
+    _progress_entry_cache.pop(url, None)
+    _flush_pending_history()
 
 def _finalize_extraction(archive_path, dest_dir, url):
     """Fonction utilitaire pour finaliser l'extraction (suppression fichier + historique).
@@ -1210,39 +1653,88 @@ def _finalize_extraction(archive_path, dest_dir, url):
         logger.error(f"Erreur lors de la finalisation de l'extraction: {str(e)}")
         return True, _("utils_extracted").format(os.path.basename(archive_path))
 
-def _capture_directories_before_extraction(dest_dir):
-    """Capture les dossiers existants avant extraction pour détection PS3."""
+# Extensions testées sans tenir compte de la casse: seul le suffixe (4 caractères) est mis en minuscules,
+# pas le nom complet
+_ISO_EXT = '.iso'
+_ZIP_EXT = '.zip'
+
+def _iter_isos(path):
+    """Générateur récursif (os.scandir) des chemins absolus des fichiers .iso sous path, sans suivre les liens de dossiers."""
     try:
-        return set([d for d in os.listdir(dest_dir) if os.path.isdir(os.path.join(dest_dir, d))])
-    except Exception:
-        return set()
+        with os.scandir(path) as it:
+            entries = list(it)
+    except OSError:
+        return
+    for entry in entries:
+        try:
+            if entry.is_dir():
+                if not entry.is_symlink():
+                    yield from _iter_isos(entry.path)
+            elif entry.name[-4:].lower() == _ISO_EXT:
+                yield os.path.abspath(entry.path)
+        except OSError:
+            continue
 
-def _capture_all_items_before_extraction(dest_dir):
-    """Capture tous les éléments (fichiers et dossiers) existants avant extraction pour DOS."""
+def _snapshot_dest(dest_dir, with_isos=True):
+    """Capture l'état du dossier cible avant extraction en un seul passage os.scandir.
+
+    Returns:
+        tuple: (dossiers de premier niveau pour PS3, tous les éléments de premier niveau pour DOS/ScummVM/PSVita,
+                chemins absolus des .iso de l'arborescence pour Xbox — vide si with_isos est False)
+    """
+    dirs, items, isos = set(), set(), set()
     try:
-        return set(os.listdir(dest_dir))
-    except Exception:
-        return set()
+        with os.scandir(dest_dir) as it:
+            entries = list(it)
+    except OSError:
+        return dirs, items, isos
+    for entry in entries:
+        items.add(entry.name)
+        try:
+            if entry.is_dir():
+                dirs.add(entry.name)
+                if with_isos and not entry.is_symlink():
+                    isos.update(_iter_isos(entry.path))
+            elif with_isos and entry.name[-4:].lower() == _ISO_EXT:
+                isos.add(os.path.abspath(entry.path))
+        except OSError:
+            continue
+    return dirs, items, isos
 
-def _handle_special_platforms(dest_dir, archive_path, before_dirs, iso_before=None, url=None, before_items=None):
+@functools.lru_cache(maxsize=4)
+def _special_platform_dirs(roms_folder):
+    """Dossiers ROM des plateformes à traitement spécifique, calculés une fois par ROMS_FOLDER.
+    Xbox, PS3 et PSVita acceptent aussi le sous-dossier du même nom (symlink activé)."""
+    return {
+        "xbox": frozenset({os.path.join(roms_folder, "xbox"), os.path.join(roms_folder, "xbox", "xbox")}),
+        "ps3": frozenset({os.path.join(roms_folder, "ps3"), os.path.join(roms_folder, "ps3", "ps3")}),
+        "dos": frozenset({os.path.join(roms_folder, "dos")}),
+        "scummvm": frozenset({os.path.join(roms_folder, "scummvm")}),
+        "psvita": frozenset({os.path.join(roms_folder, "psvita"), os.path.join(roms_folder, "psvita", "psvita")}),
+    }
+
+def _handle_special_platforms(dest_dir, archive_path, before_dirs, iso_before=None, url=None, before_items=None, written_paths=None):
     """Gère les traitements spéciaux Xbox, PS3 et DOS après extraction.
     
     Args:
         before_items: Set de tous les éléments (fichiers+dossiers) avant extraction (pour DOS)
+        written_paths: Liste des fichiers écrits par l'extraction; si fournie, les nouveaux ISO (Xbox)
+            et dossiers (PS3) en sont déduits sans nouveau parcours du dossier cible
     """
     # Xbox: conversion ISO
     # Gérer les deux cas: symlink activé (xbox/xbox) ou désactivé (xbox)
-    xbox_dir_normal = os.path.join(config.ROMS_FOLDER, "xbox")
-    xbox_dir_symlink = os.path.join(config.ROMS_FOLDER, "xbox", "xbox")
-    is_xbox = (dest_dir == xbox_dir_normal or dest_dir == xbox_dir_symlink)
+    special_dirs = _special_platform_dirs(config.ROMS_FOLDER)
+    is_xbox = dest_dir in special_dirs["xbox"]
     
     if is_xbox and iso_before is not None:
-        iso_after = set()
-        for root, dirs, files in os.walk(dest_dir):
-            for file in files:
-                if file.lower().endswith('.iso'):
-                    iso_after.add(os.path.abspath(os.path.join(root, file)))
-        new_isos = list(iso_after - iso_before)
+        if written_paths is not None:
+            new_isos = list(dict.fromkeys(
+                p for p in map(os.path.abspath, written_paths)
+                if p[-4:].lower() == _ISO_EXT and p not in iso_before
+            ))
+        else:
+            iso_after = set(_iter_isos(dest_dir))
+            new_isos = list(iso_after - iso_before)
         if new_isos:
             success, error_msg = handle_xbox(dest_dir, new_isos, url)
             if not success:
@@ -1252,19 +1744,22 @@ def _handle_special_platforms(dest_dir, archive_path, before_dirs, iso_before=No
 
     # Dossier PS3: traitement spécifique
     # Gérer les deux cas: symlink activé (ps3/ps3) ou désactivé (ps3)
-    ps3_dir_normal = os.path.join(config.ROMS_FOLDER, "ps3")
-    ps3_dir_symlink = os.path.join(config.ROMS_FOLDER, "ps3", "ps3")
-    is_ps3 = (dest_dir == ps3_dir_normal or dest_dir == ps3_dir_symlink)
+    is_ps3 = dest_dir in special_dirs["ps3"]
     
     if is_ps3:
         # PS3 Redump: décryptage et extraction
         logger.info("Détection PS3 Redump - lancement du traitement spécifique")
         
         # Calculer les nouveaux dossiers créés lors de l'extraction
-        try:
-            after_dirs = set([d for d in os.listdir(dest_dir) if os.path.isdir(os.path.join(dest_dir, d))])
-        except Exception:
-            after_dirs = set()
+        if written_paths is not None:
+            # Premier composant des fichiers écrits dans un sous-dossier
+            prefix_len = len(os.path.join(dest_dir, ''))
+            after_dirs = {rel.split(os.sep, 1)[0] for rel in (p[prefix_len:] for p in written_paths) if os.sep in rel}
+        else:
+            try:
+                after_dirs = set([d for d in os.listdir(dest_dir) if os.path.isdir(os.path.join(dest_dir, d))])
+            except Exception:
+                after_dirs = set()
         
         ignore_names = {"ps3", "images", "videos", "manuals", "media"}
         new_dirs = [d for d in (after_dirs - before_dirs) if d not in ignore_names and not d.endswith('.ps3')]
@@ -1282,8 +1777,7 @@ def _handle_special_platforms(dest_dir, archive_path, before_dirs, iso_before=No
         return True, None
 
     # DOS: organisation en dossiers .pc
-    dos_dir = os.path.join(config.ROMS_FOLDER, "dos")
-    if dest_dir == dos_dir:
+    if dest_dir in special_dirs["dos"]:
         expected_base = os.path.splitext(os.path.basename(archive_path))[0]
         # Utiliser before_items si fourni, sinon before_dirs pour rétro-compatibilité
         items_before = before_items if before_items is not None else before_dirs
@@ -1292,8 +1786,7 @@ def _handle_special_platforms(dest_dir, archive_path, before_dirs, iso_before=No
             return False, error_msg
     
     # ScummVM: organisation en dossiers + fichier .scummvm
-    scummvm_dir = os.path.join(config.ROMS_FOLDER, "scummvm")
-    if dest_dir == scummvm_dir:
+    if dest_dir in special_dirs["scummvm"]:
         expected_base = os.path.splitext(os.path.basename(archive_path))[0]
         # Utiliser before_items si fourni, sinon before_dirs pour rétro-compatibilité
         items_before = before_items if before_items is not None else before_dirs
@@ -1302,9 +1795,7 @@ def _handle_special_platforms(dest_dir, archive_path, before_dirs, iso_before=No
             return False, error_msg
     
     # PSVita: extraction dans ux0/app + création fichier .psvita
-    psvita_dir_normal = os.path.join(config.ROMS_FOLDER, "psvita")
-    psvita_dir_symlink = os.path.join(config.ROMS_FOLDER, "psvita", "psvita")
-    is_psvita = (dest_dir == psvita_dir_normal or dest_dir == psvita_dir_symlink)
+    is_psvita = dest_dir in special_dirs["psvita"]
     
     if is_psvita:
         expected_base = os.path.splitext(os.path.basename(archive_path))[0]
@@ -1317,43 +1808,41 @@ def _handle_special_platforms(dest_dir, archive_path, before_dirs, iso_before=No
 
 def extract_zip(zip_path, dest_dir, url):
     """Extrait le contenu du fichier ZIP dans le dossier cible avec un suivi progressif de la progression."""
-    logger.debug(f"Extraction de {zip_path} dans {dest_dir}")
+    logger.debug("Extraction de %s dans %s", zip_path, dest_dir)
     try:
-        # Capture état initial
-        before_dirs = _capture_directories_before_extraction(dest_dir)
-        # Capture tous les items pour DOS
-        before_items = _capture_all_items_before_extraction(dest_dir)
-        iso_before = set()
-        for root, dirs, files in os.walk(dest_dir):
-            for file in files:
-                if file.lower().endswith('.iso'):
-                    iso_before.add(os.path.abspath(os.path.join(root, file)))
+        # Capture état initial (dossiers pour PS3, tous les items pour DOS, ISO pour Xbox) en un seul passage
+        before_dirs, before_items, iso_before = _snapshot_dest(dest_dir)
 
         # Vérification et extraction
         with zipfile.ZipFile(zip_path, 'r') as zip_ref:
             zip_ref.testzip()  # Vérifier l'intégrité de l'archive
             
             # Pré-analyse pour détecter les conflits fichier/dossier
-            all_paths = set()
+            # Sous Linux le séparateur ZIP est déjà celui de l'OS: pas de replace
+            # Un seul passage sur infolist(): fichiers à extraire (avec leur chemin normalisé) et taille totale
+            sep_is_slash = os.sep == '/'
             file_paths = set()
+            files_to_extract = []  # [(info, chemin normalisé)] dans l'ordre de l'archive
+            total_size = 0
             for info in zip_ref.infolist():
-                normalized = info.filename.replace('/', os.sep)
-                if not info.is_dir():
-                    file_paths.add(normalized)
-                all_paths.add(normalized)
+                if info.is_dir():
+                    continue
+                normalized = info.filename if sep_is_slash else info.filename.replace('/', os.sep)
+                file_paths.add(normalized)
+                files_to_extract.append((info, normalized))
+                total_size += info.file_size
             
             # Identifier les conflits (un fichier existe avec un nom qui est aussi un dossier parent)
-            conflicts = set()
+            all_parents = set()
             for file_path in file_paths:
-                # Vérifier si un parent de ce fichier existe aussi comme fichier
-                parts = file_path.split(os.sep)
-                for i in range(1, len(parts)):
-                    parent_path = os.sep.join(parts[:i])
-                    if parent_path in file_paths:
-                        conflicts.add(parent_path)
-                        logger.warning(f"Conflit détecté: '{parent_path}' est à la fois un fichier et un dossier parent")
-            
-            total_size = sum(info.file_size for info in zip_ref.infolist() if not info.is_dir())
+                i = file_path.find(os.sep)
+                while i != -1:
+                    all_parents.add(file_path[:i])
+                    i = file_path.find(os.sep, i + 1)
+            conflicts = frozenset(file_paths & all_parents)
+            for parent_path in conflicts:
+                logger.warning(f"Conflit détecté: '{parent_path}' est à la fois un fichier et un dossier parent")
+            
             logger.info(f"Taille totale à extraire: {total_size} octets")
             
             if total_size == 0:
@@ -1362,41 +1851,53 @@ def extract_zip(zip_path, dest_dir, url):
 
             # Variables de progression
             extracted_size = 0
+            next_report = 0  # seuil du prochain appel à _update_extraction_progress
+            size_lock = threading.Lock()  # Protège extracted_size/next_report (partagés entre les threads d'extraction)
             lock = threading.Lock()
-            last_save_time = [time.time()]  # Liste pour référence mutable
-            chunk_size = 2048
+            chunk_size = 1 << 20  # 1 Mio
             os.makedirs(dest_dir, exist_ok=True)
 
-            # Trier les fichiers par profondeur (nombre de séparateurs) pour extraire les fichiers racine d'abord
-            files_to_extract = [info for info in zip_ref.infolist() if not info.is_dir()]
-            files_to_extract.sort(key=lambda x: x.filename.count('/'))
-            
-            # Extraction avec progression
-            for info in files_to_extract:
-                # Normaliser le chemin pour Windows (remplacer / par \)
-                normalized_filename = info.filename.replace('/', os.sep)
+            # Pas de tri par profondeur: les conflits fichier/dossier sont déjà écartés via `conflicts`,
+            # et l'ordre d'extraction réel est fixé plus bas (plus gros fichiers d'abord)
+            
+            # Préparation séquentielle: dossiers parents et conflits avec l'existant
+            jobs = {}  # {file_path: info} (une entrée en double écrase la précédente, comme en séquentiel)
+            dest_prefix = os.path.join(dest_dir, '')
+            created_dirs = {dest_dir}  # dossiers parents déjà créés (évite un makedirs/stat par fichier)
+            # Noms de premier niveau déjà présents avant extraction: un membre sous un nouveau nom (cas général,
+            # et tous les membres si dest_dir était vide) ne peut rien écraser, inutile de tester l'existant
+            existing_top = {os.path.normcase(name) for name in before_items}
+            for info, normalized_filename in files_to_extract:
                 
                 # Debug pour fichiers .nca
                 if normalized_filename.endswith('.nca'):
-                    logger.debug(f"Traitement fichier NCA: {normalized_filename}")
+                    logger.debug("Traitement fichier NCA: %s", normalized_filename)
                 
                 # Ignorer les fichiers en conflit (ils sont des dossiers parents pour d'autres fichiers)
                 if normalized_filename in conflicts:
                     logger.warning(f"Fichier ignoré (conflit avec dossier): {normalized_filename}")
                     continue
                 
-                file_path = os.path.join(dest_dir, normalized_filename)
+                file_path = dest_prefix + normalized_filename
                 
                 try:
                     # Créer uniquement le dossier parent, pas le fichier lui-même
                     parent_dir = os.path.dirname(file_path)
-                    # Vérifier que parent_dir n'est pas vide et est différent de dest_dir
-                    if parent_dir and parent_dir != dest_dir:
+                    # Vérifier que parent_dir n'est pas vide et n'a pas déjà été créé (dest_dir inclus)
+                    if parent_dir and parent_dir not in created_dirs:
                         os.makedirs(parent_dir, exist_ok=True)
+                        # Le dossier et tous ses ancêtres existent désormais
+                        while parent_dir and parent_dir not in created_dirs:
+                            created_dirs.add(parent_dir)
+                            parent_dir = os.path.dirname(parent_dir)
                 except Exception as dir_err:
                     logger.error(f"Erreur création dossier parent pour {file_path}: {dir_err}")
                     raise
                 
+                if not existing_top or os.path.normcase(normalized_filename.split(os.sep, 1)[0]) not in existing_top:
+                    jobs[file_path] = info
+                    continue
+                
                 try:
                     # Vérifier si un dossier existe avec le même nom (conflit)
                     if os.path.isdir(file_path):
@@ -1413,27 +1914,85 @@ def extract_zip(zip_path, dest_dir, url):
                             os.chmod(file_path, 0o644)
                         except Exception:
                             pass
+                except Exception as file_err:
+                    logger.error(f"Erreur extraction fichier {info.filename} vers {file_path}: {file_err}")
+                    raise
+                jobs[file_path] = info
+
+            # Extraction parallèle: la décompression zlib libère le GIL.
+            # ZipFile n'est pas thread-safe: chaque thread ouvre son propre handle sur l'archive.
+            thread_state = threading.local()
+            handles = []
+            # Sous Windows, chmod ne touche que l'attribut lecture seule, absent des fichiers qu'on vient de créer
+            set_file_modes = config.OPERATING_SYSTEM != "Windows"
+
+            def extract_member(info, file_path):
+                nonlocal extracted_size, next_report
+                member_zip = getattr(thread_state, "zip_ref", None)
+                if member_zip is None:
+                    member_zip = thread_state.zip_ref = zipfile.ZipFile(zip_path, 'r')
+                    with size_lock:
+                        handles.append(member_zip)
+                try:
+                    if info.file_size == 0:
+                        # Fichier vide: pas de lecture dans l'archive
+                        open(file_path, 'wb').close()
+                    else:
+                        # Tampon plafonné à la taille du fichier: les petits fichiers sont lus en un seul appel
+                        # (une seule mise à jour de progression), les gros par blocs de 1 Mio
+                        buffer_size = min(info.file_size, chunk_size)
+                        with member_zip.open(info) as source, open(file_path, 'wb') as dest:
+                            while True:
+                                chunk = source.read(buffer_size)
+                                if not chunk:
+                                    break
+                                dest.write(chunk)
+                                with size_lock:
+                                    extracted_size += len(chunk)
+                                    current_size = extracted_size
+                                    report = current_size >= next_report or current_size >= total_size
+                                    if report:
+                                        next_report = current_size + _PROGRESS_REPORT_BYTES
+                                if report:
+                                    _update_extraction_progress(url, current_size, total_size, lock)
                     
-                    with zip_ref.open(info) as source, open(file_path, 'wb') as dest:
-                        while True:
-                            chunk = source.read(chunk_size)
-                            if not chunk:
-                                break
-                            dest.write(chunk)
-                            extracted_size += len(chunk)
-                            _update_extraction_progress(url, extracted_size, total_size, lock, last_save_time)
-                    
-                    # Définir les permissions (skip sur Windows si erreur)
-                    try:
-                        os.chmod(file_path, 0o644)
-                    except (OSError, PermissionError) as chmod_err:
-                        logger.debug(f"Impossible de définir chmod pour {file_path}: {chmod_err}")
+                    # Définir les permissions (inutile sous Windows)
+                    if set_file_modes:
+                        try:
+                            os.chmod(file_path, 0o644)
+                        except (OSError, PermissionError) as chmod_err:
+                            logger.debug("Impossible de définir chmod pour %s: %s", file_path, chmod_err)
                 except Exception as file_err:
                     logger.error(f"Erreur extraction fichier {info.filename} vers {file_path}: {file_err}")
                     raise
 
+            max_workers = max(1, min(8, os.cpu_count() or 4, len(jobs)))
+            # Plus gros fichiers d'abord pour équilibrer la charge entre les threads
+            ordered_jobs = sorted(jobs.items(), key=lambda job: job[1].file_size, reverse=True)
+            if max_workers == 1:
+                # Un seul worker (un seul fichier ou un seul CPU): extraction sur le thread courant avec le handle déjà ouvert (ni pool ni second handle)
+                thread_state.zip_ref = zip_ref
+                for file_path, info in ordered_jobs:
+                    extract_member(info, file_path)
+            else:
+                try:
+                    with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
+                        futures = [executor.submit(extract_member, info, file_path) for file_path, info in ordered_jobs]
+                        try:
+                            for future in futures:
+                                future.result()
+                        except Exception:
+                            for future in futures:
+                                future.cancel()
+                            raise
+                finally:
+                    for member_zip in handles:
+                        member_zip.close()
+            # Chemins des fichiers écrits (détection des nouveaux ISO/dossiers sans rescanner)
+            written_paths = list(jobs)
+
         # Gestion plateformes spéciales
-        success, error_msg = _handle_special_platforms(dest_dir, zip_path, before_dirs, iso_before, url, before_items)
+        success, error_msg = _handle_special_platforms(dest_dir, zip_path, before_dirs, iso_before, url, before_items, written_paths)
         if not success:
             return False, error_msg
 
@@ -1449,106 +2008,210 @@ def extract_zip(zip_path, dest_dir, url):
     except Exception as e:
         logger.error(f"Erreur lors de l'extraction de {zip_path}: {str(e)}")
         return False, _("utils_extraction_failed").format(str(e))
+    finally:
+        _end_extraction_progress(url)
      
 
+# Outils externes (unrar, 7z, ps3dec) lancés sans fenêtre console sous Windows
+_CREATE_NO_WINDOW = 0x08000000
+
+def _no_window_flags():
+    """creationflags pour subprocess: pas de fenêtre console qui clignote sous Windows, 0 ailleurs."""
+    return _CREATE_NO_WINDOW if config.OPERATING_SYSTEM == "Windows" else 0
+
+# Pourcentage de progression affiché par unrar / 7z (-bsp1) pendant l'extraction
+# La sortie est découpée en segments aux \r, \b et \n (réécriture de la ligne de progression): seul un "NN%"
+# en tête de segment compte, jamais un "%" contenu dans un nom de fichier ("Extracting  jeu 100%.bin")
+_PROGRESS_SEGMENT_SPLIT_RE = re.compile(r'[\r\b\n]')
+_PERCENT_RE = re.compile(r'\s*(\d{1,3})%(?:\s|$)')
+
+def _run_with_percent_progress(cmd, on_percent):
+    """Lance une commande d'extraction et suit en direct les "NN%" de sa sortie standard.
+    on_percent(percent) est appelé à chaque nouveau pourcentage (croissant).
+    Retourne (code retour, stderr décodé); la sortie standard n'est pas conservée."""
+    process = subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE,
+                               creationflags=_no_window_flags())
+    # stderr lu dans un thread pour ne pas bloquer le processus si le pipe se remplit
+    stderr_chunks = []
+    stderr_thread = threading.Thread(target=lambda: stderr_chunks.append(process.stderr.read()), daemon=True)
+    stderr_thread.start()
+
+    last_percent = 0
+
+    def handle_segments(segments):
+        nonlocal last_percent
+        for segment in reversed(segments):
+            match = _PERCENT_RE.match(segment)
+            if match:
+                percent = min(100, max(last_percent, int(match.group(1))))
+                if percent != last_percent:
+                    last_percent = percent
+                    on_percent(percent)
+                return
+
+    # Segment incomplet de la lecture précédente (un "45%" peut être coupé entre deux lectures):
+    # analysé une seule fois, quand son séparateur arrive
+    pending = ""
+    for raw in iter(lambda: process.stdout.read1(4096), b""):
+        segments = _PROGRESS_SEGMENT_SPLIT_RE.split(pending + raw.decode("utf-8", errors="replace"))
+        pending = segments.pop()
+        handle_segments(segments)
+    handle_segments([pending])
+    process.wait()
+    stderr_thread.join()
+    stderr = b"".join(chunk for chunk in stderr_chunks if chunk).decode("utf-8", errors="replace")
+    return process.returncode, stderr
+
+def _start_extraction_progress(url, total_size):
+    """Initialise l'état de progression d'extraction affiché par l'UI."""
+    if url not in getattr(config, 'download_progress', {}):
+        config.download_progress[url] = {}
+    config.download_progress[url].update({
+        "downloaded_size": 0,
+        "total_size": total_size,
+        "status": "Extracting",
+        "progress_percent": 0
+    })
+    config.needs_redraw = True
+
+def _extract_archive_libarchive(archive_path, dest_dir, url):
+    """Extrait une archive avec libarchive (dans le processus, sans unrar), avec progression par bloc.
+    Lève une exception en cas d'échec: l'appelant se replie alors sur unrar."""
+    # Pas de passage préalable sur les en-têtes: dans une archive solide, sauter les données d'une entrée
+    # oblige libarchive à la décompresser. La progression compare les octets compressés déjà consommés
+    # (archive.bytes_read) à la taille de l'archive: deux mesures de la même grandeur.
+    total_size = os.path.getsize(archive_path)
+    logger.info(f"Taille de l'archive (libarchive): {total_size} octets")
+    _start_extraction_progress(url, total_size)
+
+    lock = threading.Lock()
+    root = os.path.join(os.path.abspath(dest_dir), '')
+    extracted_size = 0
+    next_report = 0
+    last_percent = -1
+
+    def set_progress(progress_percent):
+        nonlocal last_percent
+        if progress_percent == last_percent:
+            return
+        last_percent = progress_percent
+        _update_extraction_progress(url, progress_percent, 100, lock)
+        config.download_progress[url]["downloaded_size"] = progress_percent * total_size // 100
+        config.download_progress[url]["progress_percent"] = progress_percent
+        config.needs_redraw = True
+
+    set_file_modes = config.OPERATING_SYSTEM != "Windows"
+    with libarchive.file_reader(archive_path) as archive:
+        for entry in archive:
+            target = os.path.abspath(os.path.join(dest_dir, entry.pathname))
+            if not target.startswith(root):
+                logger.warning(f"Entrée ignorée (hors du dossier cible): {entry.pathname}")
+                continue
+            if entry.isdir:
+                os.makedirs(target, exist_ok=True)
+                continue
+            if not entry.isfile:
+                logger.warning(f"Entrée ignorée (ni fichier ni dossier): {entry.pathname}")
+                continue
+            os.makedirs(os.path.dirname(target), exist_ok=True)
+            with open(target, 'wb') as dest:
+                for block in entry.get_blocks():
+                    dest.write(block)
+                    extracted_size += len(block)
+                    if extracted_size < next_report:
+                        continue
+                    next_report = extracted_size + _PROGRESS_REPORT_BYTES
+                    # 100% seulement une fois la dernière entrée écrite
+                    set_progress(min(99, archive.bytes_read * 100 // total_size) if total_size > 0 else 0)
+            if set_file_modes:
+                os.chmod(target, 0o644)
+    set_progress(100)
+    return True
+
+def _extract_rar_unrar(rar_path, dest_dir, url):
+    """Extrait le RAR avec la commande unrar. Retourne (succès, message d'erreur)."""
+    # Configuration commande unrar selon l'OS
+    if config.OPERATING_SYSTEM == "Windows":
+        unrar_cmd = [config.UNRAR_EXE]
+    else:
+        unrar_cmd = ["unrar"]
+
+    # Vérification disponibilité unrar (simple recherche du binaire, sans le lancer)
+    if config.OPERATING_SYSTEM == "Windows":
+        unrar_available = os.access(config.UNRAR_EXE, os.X_OK)
+    else:
+        unrar_available = shutil.which(unrar_cmd[0]) is not None
+    if not unrar_available:
+        logger.error("Commande unrar non disponible")
+        return False, _("utils_unrar_unavailable")
+
+    # Pas de listing préalable (unrar l -v relit tout le répertoire de l'archive): la progression
+    # vient uniquement des pourcentages affichés par unrar, rapportés à la taille de l'archive
+    total_size = os.path.getsize(rar_path)
+    logger.info(f"Taille de l'archive RAR: {total_size} octets")
+
+    # Variables de progression
+    lock = threading.Lock()
+
+    # Initialisation progression
+    _start_extraction_progress(url, total_size)
+
+    def set_rar_progress(progress_percent):
+        _update_extraction_progress(url, progress_percent, 100, lock)
+        with lock:
+            if url in config.download_progress:
+                config.download_progress[url]["downloaded_size"] = progress_percent * total_size // 100
+                config.download_progress[url]["progress_percent"] = progress_percent
+                config.needs_redraw = True
+
+    # Extraction RAR: progression lue en direct dans la sortie de unrar ("... 45%")
+    # -ai: ignorer les attributs stockés dans l'archive, les fichiers reçoivent les permissions par défaut
+    # (évite un chmod par fichier après extraction)
+    returncode, stderr = _run_with_percent_progress(unrar_cmd + ['x', '-y', '-ai', rar_path, dest_dir], set_rar_progress)
+
+    if returncode != 0:
+        logger.error(f"Erreur lors de l'extraction de {rar_path}: {stderr}")
+        return False, f"Erreur lors de l'extraction: {stderr}"
+
+    set_rar_progress(100)
+    return True, None
+
 # Fonction pour extraire le contenu d'un fichier RAR
 def extract_rar(rar_path, dest_dir, url):
-    """Extrait le contenu du fichier RAR dans le dossier cible."""
+    """Extrait le contenu du fichier RAR dans le dossier cible (libarchive si disponible, sinon unrar)."""
     try:
         os.makedirs(dest_dir, exist_ok=True)
-        
-        # Configuration commande unrar selon l'OS
-        if config.OPERATING_SYSTEM == "Windows":
-            unrar_cmd = [config.UNRAR_EXE]
-        else:
-            unrar_cmd = ["unrar"]
-
-        # Vérification disponibilité unrar
-        result = subprocess.run(unrar_cmd, capture_output=True, text=True)
-        if result.returncode not in [0, 1]:
-            logger.error("Commande unrar non disponible")
-            return False, _("utils_unrar_unavailable")
-
-        # Analyse contenu RAR
-        result = subprocess.run(unrar_cmd + ['l', '-v', rar_path], capture_output=True, text=True)
-        if result.returncode != 0:
-            error_msg = result.stderr.strip()
-            logger.error(f"Erreur lors de la liste des fichiers RAR: {error_msg}")
-            return False, _("utils_rar_list_failed").format(error_msg)
-
-        # Parse liste fichiers
-        total_size = 0
-        files_to_extract = []
-        lines = result.stdout.splitlines()
-        in_file_list = False
-        for line in lines:
-            if line.startswith("----"):
-                in_file_list = not in_file_list
-                continue
-            if in_file_list:
-                match = re.match(r'^\s*(\S+)\s+(\d+)\s+\d*\s*(\d{4}-\d{2}-\d{2}\s+\d{2}:\d{2})\s+(.+)$', line)
-                if match:
-                    attrs, file_size, file_date, file_name = match.groups()
-                    if 'D' not in attrs:  # Pas un dossier
-                        files_to_extract.append((file_name.strip(), int(file_size)))
-                        total_size += int(file_size)
-
-        logger.info(f"Taille totale à extraire (RAR): {total_size} octets")
-        if total_size == 0:
-            logger.warning("RAR vide, ne contenant que des dossiers, ou erreur de parsing")
-            return False, "RAR vide ou erreur lors de la liste des fichiers"
 
         # Capture état initial
-        before_dirs = _capture_directories_before_extraction(dest_dir)
-
-        # Variables de progression
-        lock = threading.Lock()
-        last_save_time = [time.time()]  # Liste pour référence mutable
-
-        # Initialisation progression
-        if url not in getattr(config, 'download_progress', {}):
-            config.download_progress[url] = {}
-        config.download_progress[url].update({
-            "downloaded_size": 0,
-            "total_size": total_size,
-            "status": "Extracting",
-            "progress_percent": 0
-        })
-        config.needs_redraw = True
+        before_dirs = _snapshot_dest(dest_dir, with_isos=False)[0]
 
-        # Extraction RAR
-        process = subprocess.Popen(unrar_cmd + ['x', '-y', rar_path, dest_dir],
-                                 stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True)
-        stdout, stderr = process.communicate()
-
-        if process.returncode != 0:
-            logger.error(f"Erreur lors de l'extraction de {rar_path}: {stderr}")
-            return False, f"Erreur lors de l'extraction: {stderr}"
-
-        # Vérification et mise à jour progression des fichiers extraits
-        extracted_size = 0
-        total_files = len(files_to_extract)
-        for i, (expected_file, file_size) in enumerate(files_to_extract):
-            file_path = os.path.join(dest_dir, expected_file)
-            if os.path.exists(file_path):
-                extracted_size += file_size
-                os.chmod(file_path, 0o644)
-                
-                # Mise à jour progression basée sur nombre de fichiers
-                progress_percent = int(((i + 1) / total_files * 100)) if total_files > 0 else 0
-                _update_extraction_progress(url, progress_percent * total_size // 100, total_size, lock, last_save_time)
-                
-                # Mise à jour config.download_progress
-                with lock:
-                    if url in config.download_progress:
-                        config.download_progress[url]["downloaded_size"] = extracted_size
-                        config.download_progress[url]["progress_percent"] = progress_percent
-                        config.needs_redraw = True
+        extracted = False
+        if libarchive is not None:
+            try:
+                extracted = _extract_archive_libarchive(rar_path, dest_dir, url)
+            except Exception as e:
+                logger.warning(f"Extraction libarchive impossible pour {rar_path}, repli sur unrar "
+                               f"(les fichiers partiellement extraits seront écrasés): {e}")
+                # Repartir de 0% (écran et historique) avant la seconde extraction
+                _progress_last.pop(url, None)
+                _start_extraction_progress(url, os.path.getsize(rar_path))
+                _update_extraction_progress(url, 0, 100, threading.Lock())
+        if not extracted:
+            success, error_msg = _extract_rar_unrar(rar_path, dest_dir, url)
+            if not success:
+                return False, error_msg
 
-        # Permissions dossiers
-        for root, dirs, files in os.walk(dest_dir):
-            for dir_name in dirs:
-                os.chmod(os.path.join(root, dir_name), 0o755)
+        # Permissions des dossiers créés par l'extraction uniquement (inutile sous Windows):
+        # les dossiers déjà présents dans le dossier ROM ne sont pas reparcourus
+        if config.OPERATING_SYSTEM != "Windows":
+            with os.scandir(dest_dir) as it:
+                new_dirs = [e.path for e in it
+                            if e.name not in before_dirs and e.is_dir(follow_symlinks=False)]
+            for new_dir in new_dirs:
+                os.chmod(new_dir, 0o755)
+                for root, dirs, files in os.walk(new_dir):
+                    for dir_name in dirs:
+                        os.chmod(os.path.join(root, dir_name), 0o755)
 
         # Gestion plateformes spéciales (uniquement PS3 pour RAR)
         success, error_msg = _handle_special_platforms(dest_dir, rar_path, before_dirs)
@@ -1562,6 +2225,7 @@ def extract_rar(rar_path, dest_dir, url):
         logger.error(f"Erreur lors de l'extraction de {rar_path}: {str(e)}")
         return False, f"Erreur lors de l'extraction: {str(e)}"
     finally:
+        _end_extraction_progress(url)
         # Nettoyage en cas d'erreur
         if os.path.exists(rar_path):
             try:
@@ -1587,9 +2251,7 @@ def handle_ps3(dest_dir, new_dirs=None, extracted_basename=None, url=None, archi
     logger.debug(f"Traitement spécifique PS3 dans: {dest_dir}")
     
     # Détection du mode PS3 - supporter les deux cas: symlink activé (ps3/ps3) ou désactivé (ps3)
-    ps3_dir_normal = os.path.join(config.ROMS_FOLDER, "ps3")
-    ps3_dir_symlink = os.path.join(config.ROMS_FOLDER, "ps3", "ps3")
-    is_ps3 = (dest_dir == ps3_dir_normal or dest_dir == ps3_dir_symlink)
+    is_ps3 = dest_dir in _special_platform_dirs(config.ROMS_FOLDER)["ps3"]
     
     if is_ps3:
         # ============================================
@@ -1609,8 +2271,17 @@ def handle_ps3(dest_dir, new_dirs=None, extracted_basename=None, url=None, archi
             logger.debug(f"URL jeu: {url}")
             logger.debug(f"URL clé: {key_url}")
             
-            # Chercher le fichier .iso déjà extrait
-            iso_files = [f for f in os.listdir(dest_dir) if f.endswith('.iso') and not f.endswith('_decrypted.iso')]
+            # Chercher le fichier .iso déjà extrait, et les clés .dkey locales dans le même passage
+            # (utilisées seulement si le téléchargement de la clé échoue)
+            iso_files, local_dkey_files = [], []
+            with os.scandir(dest_dir) as it:
+                for entry in it:
+                    name = entry.name
+                    if name.endswith('.iso'):
+                        if not name.endswith('_decrypted.iso') and entry.is_file():
+                            iso_files.append(name)
+                    elif name.endswith('.dkey') and entry.is_file():
+                        local_dkey_files.append(name)
             if not iso_files:
                 return False, "Aucun fichier .iso trouvé après extraction"
             
@@ -1622,44 +2293,33 @@ def handle_ps3(dest_dir, new_dirs=None, extracted_basename=None, url=None, archi
             dkey_path = None
             if key_url:
                 logger.info("Téléchargement de la clé de décryption...")
-                key_zip_name = os.path.basename(archive_name) if archive_name else "key.zip"
-                key_zip_path = os.path.join(dest_dir, f"_temp_key_{key_zip_name}")
                 
                 try:
                     import requests
-                    response = requests.get(key_url, stream=True, timeout=30)
+                    response = requests.get(key_url, timeout=30)
                     response.raise_for_status()
+                    logger.info(f"Clé téléchargée: {len(response.content)} octets")
                     
-                    with open(key_zip_path, 'wb') as f:
-                        for chunk in response.iter_content(chunk_size=8192):
-                            if chunk:
-                                f.write(chunk)
-                    
-                    logger.info(f"Clé téléchargée: {key_zip_path}")
-                    
-                    # Extraire la clé
+                    # Extraire la clé directement depuis la mémoire (archive de quelques centaines d'octets)
                     logger.info("Extraction de la clé...")
-                    with zipfile.ZipFile(key_zip_path, 'r') as zf:
+                    with zipfile.ZipFile(io.BytesIO(response.content), 'r') as zf:
                         dkey_files = [f for f in zf.namelist() if f.endswith('.dkey')]
                         if not dkey_files:
                             logger.warning("Aucun fichier .dkey trouvé dans l'archive de clé")
                         else:
                             dkey_file = dkey_files[0]
-                            zf.extract(dkey_file, dest_dir)
-                            dkey_path = os.path.join(dest_dir, dkey_file)
+                            dkey_path = os.path.join(dest_dir, os.path.basename(dkey_file))
+                            with open(dkey_path, 'wb') as f:
+                                f.write(zf.read(dkey_file))
                             logger.info(f"Clé extraite: {dkey_path}")
                     
-                    # Supprimer le ZIP de la clé
-                    os.remove(key_zip_path)
-                    
                 except Exception as e:
                     logger.error(f"Erreur lors du téléchargement/extraction de la clé: {e}")
             
             # Chercher une clé .dkey si pas téléchargée
             if not dkey_path:
-                dkey_files = [f for f in os.listdir(dest_dir) if f.endswith('.dkey')]
-                if dkey_files:
-                    dkey_path = os.path.join(dest_dir, dkey_files[0])
+                if local_dkey_files:
+                    dkey_path = os.path.join(dest_dir, local_dkey_files[0])
                     logger.info(f"Clé trouvée localement: {dkey_path}")
                 else:
                     return False, "Aucune clé de décryption trouvée (.dkey)"
@@ -1686,38 +2346,15 @@ def handle_ps3(dest_dir, new_dirs=None, extracted_basename=None, url=None, archi
                     logger.error(f"Erreur lors de la vérification des permissions: {e}")
                     # Continuer quand même, l'erreur sera capturée plus tard
             
-            if config.OPERATING_SYSTEM == "Windows":
-                # Utiliser des guillemets doubles et échapper correctement pour PowerShell
-                # Doubler les guillemets doubles internes pour l'échappement PowerShell
-                dkey_escaped = dkey_path.replace('"', '""')
-                ps3dec_escaped = config.PS3DEC_EXE.replace('"', '""')
-                iso_escaped = iso_path.replace('"', '""')
-                decrypted_escaped = decrypted_iso_path.replace('"', '""')
-                
-                cmd = [
-                    "powershell", "-Command",
-                    f'$key = (Get-Content "{dkey_escaped}" -Raw).Trim(); ' +
-                    f'& "{ps3dec_escaped}" d key $key "{iso_escaped}" "{decrypted_escaped}"'
-                ]
-            else:  # Linux
-                # Utiliser des guillemets doubles avec échappement pour bash
-                # Échapper les caractères spéciaux: $, `, \, ", et !
-                def bash_escape(path):
-                    return path.replace('\\', '\\\\').replace('"', '\\"').replace('$', '\\$').replace('`', '\\`')
-                
-                dkey_escaped = bash_escape(dkey_path)
-                ps3dec_escaped = bash_escape(config.PS3DEC_LINUX)
-                iso_escaped = bash_escape(iso_path)
-                decrypted_escaped = bash_escape(decrypted_iso_path)
-                
-                cmd = [
-                    "bash", "-c",
-                    f'key=$(cat "{dkey_escaped}" | tr -d \' \\n\\r\\t\'); ' +
-                    f'"{ps3dec_escaped}" d key "$key" "{iso_escaped}" "{decrypted_escaped}"'
-                ]
+            # Lire la clé directement (hex sur une ligne): ni shell ni PowerShell à démarrer,
+            # donc aucun échappement de chemins
+            with open(dkey_path, 'r', encoding='utf-8-sig') as f:
+                key = "".join(f.read().split())
+            ps3dec_tool = config.PS3DEC_EXE if config.OPERATING_SYSTEM == "Windows" else config.PS3DEC_LINUX
+            cmd = [ps3dec_tool, "d", "key", key, iso_path, decrypted_iso_path]
             
             logger.debug(f"Commande de décryptage: {' '.join(cmd)}")
-            result = subprocess.run(cmd, capture_output=True, text=True)
+            result = subprocess.run(cmd, capture_output=True, text=True, creationflags=_no_window_flags())
             
             if result.returncode != 0:
                 error_msg = f"Erreur lors du décryptage: {result.stderr}"
@@ -1751,17 +2388,33 @@ def handle_ps3(dest_dir, new_dirs=None, extracted_basename=None, url=None, archi
                     except Exception as e:
                         logger.error(f"Erreur lors de la vérification des permissions de 7zz: {e}")
                 
-                extract_cmd = [seven_z_cmd, "x", decrypted_iso_path, f"-o{game_folder_path}", "-y"]
+                # -bso0: liste des fichiers supprimée, -bsp1: progression "NN%" sur stdout (suivie en direct)
+                extract_cmd = [seven_z_cmd, "x", decrypted_iso_path, f"-o{game_folder_path}", "-y", "-bso0", "-bsp1"]
                 logger.debug(f"Commande d'extraction ISO: {' '.join(extract_cmd)}")
-                result = subprocess.run(extract_cmd, capture_output=True, text=True)
+                iso_size = os.path.getsize(decrypted_iso_path)
+                progress_lock = threading.Lock()
+                if url:
+                    _start_extraction_progress(url, iso_size)
+
+                def set_iso_progress(progress_percent):
+                    if not url:
+                        return
+                    _update_extraction_progress(url, progress_percent, 100, progress_lock)
+                    with progress_lock:
+                        if url in config.download_progress:
+                            config.download_progress[url]["downloaded_size"] = progress_percent * iso_size // 100
+                            config.download_progress[url]["progress_percent"] = progress_percent
+                            config.needs_redraw = True
+
+                returncode, stderr = _run_with_percent_progress(extract_cmd, set_iso_progress)
                 
-                if result.returncode > 2:
-                    error_msg = f"Erreur critique lors de l'extraction ISO (code {result.returncode}): {result.stderr}"
+                if returncode > 2:
+                    error_msg = f"Erreur critique lors de l'extraction ISO (code {returncode}): {stderr}"
                     logger.error(error_msg)
                     return False, error_msg
                 
-                if result.returncode != 0:
-                    logger.warning(f"7z a retourné un avertissement (code {result.returncode}): {result.stderr}")
+                if returncode != 0:
+                    logger.warning(f"7z a retourné un avertissement (code {returncode}): {stderr}")
                     logger.info("Extraction poursuivie malgré l'avertissement")
                 
                 logger.info(f"ISO extrait dans: {game_folder_path}")
@@ -1787,6 +2440,29 @@ def handle_ps3(dest_dir, new_dirs=None, extracted_basename=None, url=None, archi
             logger.error(error_msg)
             return False, error_msg
     
+def _move_item(src_path, dst_path):
+    """Déplace un élément extrait: os.rename direct (même système de fichiers, cas normal sous dest_dir),
+    shutil.move en repli (copie + suppression entre volumes, destination existante...)."""
+    try:
+        os.rename(src_path, dst_path)
+    except OSError:
+        shutil.move(src_path, dst_path)
+
+def _fast_rmtree(path):
+    """Supprime une arborescence via la commande native (rm -rf / rd /s /q): un seul processus au lieu
+    d'un stat + unlink Python par fichier. Repli sur shutil.rmtree si la commande échoue ou est absente."""
+    if config.OPERATING_SYSTEM == "Windows":
+        cmd = ["cmd", "/c", "rd", "/s", "/q", path]
+    else:
+        cmd = ["rm", "-rf", "--", path]
+    try:
+        subprocess.run(cmd, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, check=False,
+                       creationflags=_no_window_flags())
+    except OSError as e:
+        logger.debug("Suppression native impossible pour %s: %s", path, e)
+    if os.path.lexists(path):
+        shutil.rmtree(path)
+
 def handle_dos(dest_dir, before_items, extracted_basename=None):
     """Gère l'organisation spécifique des dossiers DOS extraits.
 
@@ -1797,17 +2473,17 @@ def handle_dos(dest_dir, before_items, extracted_basename=None):
         before_items: Set des éléments (fichiers+dossiers) présents avant extraction
     """
     logger.debug(f"Traitement spécifique DOS dans: {dest_dir}")
-    time.sleep(2)  # petite latence post-extraction
 
     try:
-        # Déterminer les nouveaux éléments extraits
-        after_items = set(os.listdir(dest_dir))
+        # Déterminer les nouveaux éléments extraits (DirEntry: type déjà connu, pas de stat supplémentaire)
+        with os.scandir(dest_dir) as it:
+            after_items = {e.name: e for e in it}
     except Exception:
-        after_items = set()
+        after_items = {}
 
     ignore_names = {"dos", "images", "videos", "manuals", "media"}
     # Filtrer les nouveaux éléments (fichiers ou dossiers)
-    new_items = [item for item in (after_items - before_items) 
+    new_items = [item for item in (after_items.keys() - before_items) 
                  if item not in ignore_names and not item.endswith('.pc')]
 
     if not new_items:
@@ -1824,10 +2500,10 @@ def handle_dos(dest_dir, before_items, extracted_basename=None):
     # Cas 1: Un seul dossier extrait -> le renommer en .pc
     if len(new_items) == 1:
         item_path = os.path.join(dest_dir, new_items[0])
-        if os.path.isdir(item_path):
+        if after_items[new_items[0]].is_dir():
             logger.debug(f"DOS: Un seul dossier détecté '{new_items[0]}', renommage en '{target_name}'")
             max_retries = 3
-            retry_delay = 2
+            retry_delay = 0.05  # doublé à chaque échec (handle encore tenu par un antivirus sous Windows)
             for attempt in range(max_retries):
                 try:
                     # Fermer les handles potentiellement ouverts
@@ -1845,7 +2521,6 @@ def handle_dos(dest_dir, before_items, extracted_basename=None):
 
                     if os.path.exists(target_path):
                         shutil.rmtree(target_path, ignore_errors=True)
-                        time.sleep(1)
 
                     os.rename(item_path, target_path)
                     logger.info(f"Dossier DOS renommé avec succès: {item_path} -> {target_path}")
@@ -1855,6 +2530,7 @@ def handle_dos(dest_dir, before_items, extracted_basename=None):
                     logger.warning(f"Tentative {attempt + 1}/{max_retries} échouée: {str(e)}")
                     if attempt < max_retries - 1:
                         time.sleep(retry_delay)
+                        retry_delay *= 2
                     else:
                         error_msg = f"Erreur lors du renommage DOS de {item_path} en {target_path}: {str(e)}"
                         logger.error(error_msg)
@@ -1867,7 +2543,6 @@ def handle_dos(dest_dir, before_items, extracted_basename=None):
         if os.path.exists(target_path):
             logger.warning(f"Le dossier {target_path} existe déjà, il sera remplacé")
             shutil.rmtree(target_path, ignore_errors=True)
-            time.sleep(1)
 
         os.makedirs(target_path, exist_ok=True)
 
@@ -1877,10 +2552,8 @@ def handle_dos(dest_dir, before_items, extracted_basename=None):
             dst_path = os.path.join(target_path, item)
             
             try:
-                if os.path.isdir(src_path):
-                    shutil.move(src_path, dst_path)
-                else:
-                    shutil.move(src_path, dst_path)
+                _move_item(src_path, dst_path)
+                if not after_items[item].is_dir():
                     os.chmod(dst_path, 0o644)
                 logger.debug(f"Déplacé: {item} -> {target_name}/{item}")
             except Exception as e:
@@ -1911,17 +2584,17 @@ def handle_scummvm(dest_dir, before_items, extracted_basename=None):
         extracted_basename: Nom de base du ZIP extrait (sans extension)
     """
     logger.debug(f"Traitement spécifique ScummVM dans: {dest_dir}")
-    time.sleep(2)  # Petite latence post-extraction
     
     try:
-        # Déterminer les nouveaux éléments extraits
-        after_items = set(os.listdir(dest_dir))
+        # Déterminer les nouveaux éléments extraits (DirEntry: type déjà connu, pas de stat supplémentaire)
+        with os.scandir(dest_dir) as it:
+            after_items = {e.name: e for e in it}
     except Exception:
-        after_items = set()
+        after_items = {}
     
     ignore_names = {"scummvm", "images", "videos", "manuals", "media"}
     # Filtrer les nouveaux éléments (fichiers ou dossiers)
-    new_items = [item for item in (after_items - before_items) 
+    new_items = [item for item in (after_items.keys() - before_items) 
                  if item not in ignore_names and not item.endswith('.scummvm')]
     
     if not new_items:
@@ -1951,10 +2624,7 @@ def handle_scummvm(dest_dir, before_items, extracted_basename=None):
             dst_path = os.path.join(game_folder_path, item)
             
             try:
-                if os.path.isdir(src_path):
-                    shutil.move(src_path, dst_path)
-                else:
-                    shutil.move(src_path, dst_path)
+                _move_item(src_path, dst_path)
                 logger.debug(f"Déplacé: {item} -> {game_folder_name}/{item}")
             except Exception as e:
                 logger.error(f"Erreur déplacement {item}: {e}")
@@ -1978,6 +2648,90 @@ def handle_scummvm(dest_dir, before_items, extracted_basename=None):
         return False, error_msg
 
 
+# Tampon de copie pour l'extraction membre par membre (ZIP internes PSVita: beaucoup de petits fichiers)
+_ZIP_COPY_BUFFER = 1 << 16
+_ZIP_READ_BUFFER = 1 << 20
+
+def _open_buffered_zip(zip_path):
+    """Ouvre zip_path derrière un tampon de lecture de 1 Mio (répertoire central et membres lus en gros blocs).
+    Retourne (zip_ref, fichier): l'appelant ferme les deux, ZipFile ne fermant pas un fichier qu'on lui passe."""
+    zip_file = open(zip_path, 'rb', buffering=_ZIP_READ_BUFFER)
+    try:
+        return zipfile.ZipFile(zip_file, 'r'), zip_file
+    except Exception:
+        zip_file.close()
+        raise
+
+def _extract_zip_members(zip_ref, dest_dir):
+    """Extrait un ZipFile ouvert membre par membre avec shutil.copyfileobj (remplace extractall).
+    Les dossiers sont tous créés d'abord, puis les fichiers extraits en parallèle (la décompression zlib
+    libère le GIL). Les entrées qui sortiraient de dest_dir sont ignorées.
+    Lève OSError si des membres n'ont pas pu être extraits (après avoir tenté tous les autres)."""
+    root = os.path.join(os.path.abspath(dest_dir), '')
+    dirs = set()
+    jobs = []  # [(info, chemin cible)]
+    for info in zip_ref.infolist():
+        target = os.path.abspath(os.path.join(dest_dir, info.filename))
+        if not target.startswith(root):
+            if target + os.sep != root:
+                logger.warning(f"Entrée ignorée (hors du dossier cible): {info.filename}")
+            continue
+        if info.is_dir():
+            dirs.add(target)
+        else:
+            dirs.add(os.path.dirname(target))
+            jobs.append((info, target))
+    for dir_path in sorted(dirs):
+        os.makedirs(dir_path, exist_ok=True)
+
+    # ZipFile n'est pas thread-safe: chaque thread ouvre son propre handle sur l'archive
+    thread_state = threading.local()
+    handles = []
+    handles_lock = threading.Lock()
+
+    def extract_one(info, target):
+        member_zip = getattr(thread_state, "zip_ref", None)
+        if member_zip is None:
+            member_zip, member_file = _open_buffered_zip(zip_ref.filename)
+            thread_state.zip_ref = member_zip
+            with handles_lock:
+                handles.append((member_zip, member_file))
+        with member_zip.open(info) as source, open(target, 'wb') as dest:
+            shutil.copyfileobj(source, dest, _ZIP_COPY_BUFFER)
+
+    failures = []
+    max_workers = max(1, min(8, os.cpu_count() or 4, len(jobs)))
+    if max_workers == 1:
+        thread_state.zip_ref = zip_ref
+        for info, target in jobs:
+            try:
+                extract_one(info, target)
+            except Exception as e:
+                failures.append((info.filename, e))
+    else:
+        try:
+            with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
+                futures = {executor.submit(extract_one, info, target): info.filename for info, target in jobs}
+                for future in concurrent.futures.as_completed(futures):
+                    try:
+                        future.result()
+                    except Exception as e:
+                        failures.append((futures[future], e))
+        finally:
+            for member_zip, member_file in handles:
+                member_zip.close()
+                member_file.close()
+
+    if failures:
+        for filename, e in failures:
+            logger.error(f"Erreur extraction de {filename}: {e}")
+        raise OSError(f"{len(failures)} fichier(s) non extrait(s), dont {failures[0][0]}: {failures[0][1]}")
+
+@functools.lru_cache(maxsize=4)
+def _psvita_ux0_app_dir(save_folder):
+    """Dossier ux0/app de l'émulateur PSVita (saves/psvita/ux0/app), calculé une fois par SAVE_FOLDER."""
+    return os.path.join(os.path.dirname(os.path.dirname(save_folder)), "psvita", "ux0", "app")
+
 def handle_psvita(dest_dir, before_items, extracted_basename=None):
     """Gère l'organisation spécifique des jeux PSVita extraits.
     
@@ -1997,33 +2751,45 @@ def handle_psvita(dest_dir, before_items, extracted_basename=None):
         extracted_basename: Nom de base de l'archive extraite (sans extension)
     """
     logger.debug(f"Traitement spécifique PSVita dans: {dest_dir}")
-    time.sleep(2)  # Petite latence post-extraction
-    
-    try:
-        after_items = set(os.listdir(dest_dir))
-    except Exception:
-        after_items = set()
     
     ignore_names = {"psvita", "images", "videos", "manuals", "media"}
-    # Filtrer les nouveaux éléments (fichiers ou dossiers)
-    new_items = [item for item in (after_items - before_items) 
-                 if item not in ignore_names and not item.endswith('.psvita')]
+    # Le contenu extrait est normalement déjà présent: on n'attend (2 s au plus) que s'il manque encore.
+    # Un seul os.scandir: les DirEntry donnent directement les nouveaux dossiers candidats
+    for attempt in range(20):
+        try:
+            with os.scandir(dest_dir) as it:
+                new_entries = [e for e in it
+                               if e.name not in before_items and e.name not in ignore_names and not e.name.endswith('.psvita')]
+        except Exception:
+            new_entries = []
+        if new_entries:
+            break
+        time.sleep(0.1)
     
-    if not new_items:
+    if not new_entries:
         logger.warning("PSVita: Aucun nouveau dossier détecté après extraction")
         return True, None
     
     if not extracted_basename:
-        extracted_basename = new_items[0] if new_items else "game"
+        extracted_basename = new_entries[0].name
     
-    # Chercher le dossier du jeu (normalement il n'y en a qu'un)
+    # Chercher le dossier du jeu (normalement il n'y en a qu'un) et son ZIP (IDJeu.zip) dans le même parcours
     game_folder = None
-    for item in new_items:
-        item_path = os.path.join(dest_dir, item)
-        if os.path.isdir(item_path):
-            game_folder = item
-            game_folder_path = item_path
-            break
+    zip_filename = None
+    try:
+        for entry in new_entries:
+            if not entry.is_dir():
+                continue
+            if game_folder is None:
+                game_folder, game_folder_path = entry.name, entry.path
+            with os.scandir(entry.path) as it:
+                zip_filename = next((z.name for z in it if z.name[-4:].lower() == _ZIP_EXT), None)
+            if zip_filename:
+                game_folder, game_folder_path = entry.name, entry.path
+                break
+    except OSError as e:
+        logger.error(f"PSVita: Erreur lecture du dossier extrait: {e}")
+        return False, f"Erreur PSVita: {str(e)}"
     
     if not game_folder:
         logger.error("PSVita: Aucun dossier de jeu trouvé après extraction")
@@ -2031,17 +2797,11 @@ def handle_psvita(dest_dir, before_items, extracted_basename=None):
     
     logger.debug(f"PSVita: Dossier de jeu trouvé: {game_folder}")
     
-    # Chercher le fichier ZIP à l'intérieur (IDJeu.zip)
     try:
-        contents = os.listdir(game_folder_path)
-        zip_files = [f for f in contents if f.lower().endswith('.zip')]
-        
-        if not zip_files:
+        if not zip_filename:
             logger.error(f"PSVita: Aucun fichier ZIP trouvé dans {game_folder}")
             return False, f"PSVita: Aucun ZIP trouvé dans {game_folder}"
         
-        # Prendre le premier ZIP trouvé
-        zip_filename = zip_files[0]
         zip_path = os.path.join(game_folder_path, zip_filename)
         
         # Extraire l'ID du jeu (nom du ZIP sans extension)
@@ -2053,28 +2813,29 @@ def handle_psvita(dest_dir, before_items, extracted_basename=None):
         psvita_file_path = os.path.join(dest_dir, psvita_filename)
         
         try:
-            # Créer un fichier vide .psvita
-            with open(psvita_file_path, 'w', encoding='utf-8') as f:
-                f.write(f"# PSVita Game\n")
-                f.write(f"# Game: {game_folder}\n")
-                f.write(f"# ID: {game_id}\n")
+            # Créer le fichier .psvita (quelques octets: un seul write sur le descripteur bas niveau)
+            payload = f"# PSVita Game\n# Game: {game_folder}\n# ID: {game_id}\n".encode('utf-8')
+            fd = os.open(psvita_file_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+            try:
+                os.write(fd, payload)
+            finally:
+                os.close(fd)
             logger.info(f"PSVita: Fichier .psvita créé: {psvita_filename}")
         except Exception as e:
             logger.error(f"PSVita: Erreur création fichier .psvita: {e}")
             return False, f"Erreur création {psvita_filename}: {e}"
         
         # 2. Extraire le ZIP dans le dossier parent de config.SAVE_FOLDER/psvita/ux0/app/
-        save_parent2 = os.path.dirname(config.SAVE_FOLDER)
-        save_parent = os.path.dirname(save_parent2)
-        ux0_app_dir = os.path.join(save_parent, "psvita", "ux0", "app")
+        ux0_app_dir = _psvita_ux0_app_dir(config.SAVE_FOLDER)
         os.makedirs(ux0_app_dir, exist_ok=True)
         
         logger.debug(f"PSVita: Extraction de {zip_filename} dans {ux0_app_dir}")
         
         try:
             import zipfile
-            with zipfile.ZipFile(zip_path, 'r') as zip_ref:
-                zip_ref.extractall(ux0_app_dir)
+            zip_ref, zip_file = _open_buffered_zip(zip_path)
+            with zip_file, zip_ref:
+                _extract_zip_members(zip_ref, ux0_app_dir)
             logger.info(f"PSVita: ZIP extrait avec succès dans {ux0_app_dir}")
             
             # Vérifier que le dossier game_id existe bien
@@ -2093,8 +2854,7 @@ def handle_psvita(dest_dir, before_items, extracted_basename=None):
         
         # 3. Supprimer le dossier temporaire du jeu
         try:
-            import shutil
-            shutil.rmtree(game_folder_path)
+            _fast_rmtree(game_folder_path)
             logger.info(f"PSVita: Dossier temporaire supprimé: {game_folder}")
         except Exception as e:
             logger.warning(f"PSVita: Impossible de supprimer {game_folder}: {e}")
@@ -2108,12 +2868,29 @@ def handle_psvita(dest_dir, before_items, extracted_basename=None):
         return False, f"Erreur PSVita: {str(e)}"
 
 
+def _set_progress(url, **fields):
+    """Met à jour en une fois l'état de progression de url (écran des téléchargements) et demande un rafraîchissement."""
+    config.download_progress.setdefault(url, {}).update(fields)
+    config.needs_redraw = True
+
+def _remove_xiso_backup(iso_path):
+    """Supprime le backup .old laissé par extract-xiso pour iso_path (un seul unlink, absent = ignoré)."""
+    old_file = iso_path + ".old"
+    try:
+        os.remove(old_file)
+        logger.debug(f"Fichier backup .old supprimé: {old_file}")
+    except FileNotFoundError:
+        pass
+    except Exception as e:
+        logger.warning(f"Impossible de supprimer le fichier .old: {e}")
+
+# Chemin de l'outil xdvdfs dont les permissions ont déjà été vérifiées (None: pas encore)
+_xiso_state = {"ready": None}
+
 def handle_xbox(dest_dir, iso_files, url=None):
     """Gère la conversion des fichiers Xbox extraits et met à jour l'UI (Converting)."""
     logger.debug(f"Traitement spécifique Xbox dans: {dest_dir}")
     
-    # Attendre un peu que tous les processus d'extraction se terminent
-    time.sleep(2)
     if config.OPERATING_SYSTEM == "Windows":
         # Sur Windows; telecharger le fichier exe
         XISO_EXE = config.XISO_EXE
@@ -2122,23 +2899,26 @@ def handle_xbox(dest_dir, iso_files, url=None):
     else:
         # Linux/Batocera : télécharger le fichier xdvdfs  
         XISO_LINUX = config.XISO_LINUX
-        try:
-            stat_info = os.stat(XISO_LINUX)
-            mode = stat_info.st_mode
-            logger.debug(f"Permissions de {XISO_LINUX}: {oct(mode)}")
-            logger.debug(f"Propriétaire: {stat_info.st_uid}, Groupe: {stat_info.st_gid}")
-            
-            # Vérifier si le fichier est exécutable
-            if not os.access(XISO_LINUX, os.X_OK):
-                logger.error(f"Le fichier {XISO_LINUX} n'est pas exécutable")
-                try:
-                    os.chmod(XISO_LINUX, 0o755)
-                    logger.info(f"Permissions corrigées pour {XISO_LINUX}")
-                except Exception as e:
-                    logger.error(f"Impossible de modifier les permissions: {str(e)}")
-                    return False, "Erreur de permissions sur xdvdfs"
-        except Exception as e:
-            logger.error(f"Erreur lors de la vérification des permissions: {str(e)}")
+        # Permissions vérifiées une seule fois par processus (un seul os.stat, le mode suffit)
+        if _xiso_state["ready"] != XISO_LINUX:
+            try:
+                stat_info = os.stat(XISO_LINUX)
+                mode = stat_info.st_mode
+                logger.debug(f"Permissions de {XISO_LINUX}: {oct(mode)}")
+                logger.debug(f"Propriétaire: {stat_info.st_uid}, Groupe: {stat_info.st_gid}")
+                
+                # Vérifier si le fichier est exécutable
+                if not mode & 0o111:
+                    logger.error(f"Le fichier {XISO_LINUX} n'est pas exécutable")
+                    try:
+                        os.chmod(XISO_LINUX, 0o755)
+                        logger.info(f"Permissions corrigées pour {XISO_LINUX}")
+                    except Exception as e:
+                        logger.error(f"Impossible de modifier les permissions: {str(e)}")
+                        return False, "Erreur de permissions sur xdvdfs"
+                _xiso_state["ready"] = XISO_LINUX
+            except Exception as e:
+                logger.error(f"Erreur lors de la vérification des permissions: {str(e)}")
     
         extract_xiso_cmd = [XISO_LINUX, "-r"]  # Liste avec 2 éléments
 
@@ -2150,45 +2930,40 @@ def handle_xbox(dest_dir, iso_files, url=None):
             # Normaliser/filtrer
             for p in provided_list:
                 try:
-                    if isinstance(p, str) and p.lower().endswith('.iso') and os.path.exists(p):
+                    if isinstance(p, str) and p[-4:].lower() == _ISO_EXT and os.path.exists(p):
                         iso_files.append(os.path.abspath(p))
                 except Exception:
                     continue
         else:
-            # Fallback: scan (ancienne logique)
-            for root, dirs, files in os.walk(dest_dir):
-                for file in files:
-                    if file.lower().endswith('.iso'):
-                        iso_files.append(os.path.join(root, file))
+            # Fallback: scan récursif (os.scandir) de dest_dir
+            iso_files = list(_iter_isos(dest_dir))
 
         if not iso_files:
             logger.warning("Aucun fichier ISO xbox trouvé")
             return True, None
 
         total = len(iso_files)
+        # Entrée d'historique recherchée une seule fois, puis modifiée en place
+        hist_entry = None
+        if url and isinstance(config.history, list):
+            hist_entry = next((entry for entry in config.history
+                               if entry.get("url") == url and entry.get("status") in _XBOX_HISTORY_STATUSES), None)
         # Marquer l'état comme Conversion en cours (0%)
         try:
             if url:
-                # Progress dict (pour l'écran en cours)
-                if url not in config.download_progress:
-                    config.download_progress[url] = {}
-                config.download_progress[url]["status"] = "Converting"
-                config.download_progress[url]["progress_percent"] = 0
-                config.needs_redraw = True
+                _set_progress(url, status="Converting", progress_percent=0)
                 # Historique
-                if isinstance(config.history, list):
-                    for entry in config.history:
-                        if entry.get("url") == url and entry.get("status") in ["Extracting", "Téléchargement", "Downloading"]:
-                            entry["status"] = "Converting"
-                            entry["progress"] = 0
-                            entry["message"] = "Xbox conversion in progress"
-                            save_history(config.history)
-                            break
+                if hist_entry is not None and hist_entry.get("status") in _ACTIVE_HISTORY_STATUSES:
+                    hist_entry["status"] = "Converting"
+                    hist_entry["progress"] = 0
+                    hist_entry["message"] = "Xbox conversion in progress"
+                    save_history(config.history)
         except Exception as e:
             logger.debug(f"MAJ statut conversion ignorée: {e}")
 
         logger.info(f"Démarrage conversion Xbox: {total} ISO(s)")
-        for idx, iso_xbox_source in enumerate(iso_files, start=1):
+
+        def convert_one(iso_xbox_source):
             logger.debug(f"Traitement de l'ISO Xbox: {iso_xbox_source}")
             
             # extract-xiso -r repackage l'ISO en place
@@ -2200,105 +2975,101 @@ def handle_xbox(dest_dir, iso_files, url=None):
             cmd = extract_xiso_cmd + [iso_filename]
             logger.debug(f"Exécution de la commande: {' '.join(cmd)} (cwd: {iso_dir})")
             
+            # Sortie standard ignorée (progression verbeuse); stderr décodé seulement en cas d'échec
             process = subprocess.run(
                 cmd,
-                capture_output=True,
-                text=True,
-                cwd=iso_dir
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.PIPE,
+                cwd=iso_dir,
+                creationflags=_no_window_flags()
             )
-
             if process.returncode != 0:
-                err_msg = f"Erreur lors de la conversion de l'ISO: {process.stderr}"
-                logger.error(err_msg)
-                # Mettre à jour les statuts pour éviter de rester bloqué en 'Converting'
+                return iso_xbox_source, process.returncode, process.stderr.decode("utf-8", errors="replace")
+            return iso_xbox_source, 0, ""
+
+        def stop_conversions(futures):
+            """Après un échec: annule les conversions pas encore lancées, attend celles en cours
+            et supprime le .old de chaque ISO converti avec succès."""
+            for pending in futures:
+                pending.cancel()
+            for running in futures:
+                if running.cancelled():
+                    continue
                 try:
-                    if url:
-                        if url not in config.download_progress:
-                            config.download_progress[url] = {}
-                        config.download_progress[url]["status"] = "Error"
-                        config.download_progress[url]["message"] = process.stderr
-                        config.download_progress[url]["progress_percent"] = 0
-                        config.needs_redraw = True
-                        if isinstance(config.history, list):
-                            for entry in config.history:
-                                if entry.get("url") == url and entry.get("status") in ("Converting", "Extracting", "Téléchargement", "Downloading"):
-                                    entry["status"] = "Error"
-                                    entry["message"] = process.stderr
-                                    save_history(config.history)
-                                    break
+                    iso_path, returncode, _stderr = running.result()
                 except Exception:
-                    pass
-                return False, err_msg
-
-            # Vérifier que l'ISO existe toujours (extract-xiso le modifie en place)
-            if os.path.exists(iso_xbox_source):
-                logger.info(f"ISO repackagé avec succès: {iso_xbox_source}")
-                logger.debug(f"ISO converti au format XISO en place")
-                
-                # Supprimer le fichier .old créé par extract-xiso (backup)
-                old_file = iso_xbox_source + ".old"
-                if os.path.exists(old_file):
+                    continue
+                if returncode == 0 and os.path.exists(iso_path):
+                    _remove_xiso_backup(iso_path)
+
+        # Un processus extract-xiso indépendant par ISO: conversions en parallèle,
+        # limitées à 4 pour ne pas saturer le disque. Résultats traités ici, dans l'ordre d'achèvement.
+        with concurrent.futures.ThreadPoolExecutor(max_workers=min(4, total)) as executor:
+            futures = [executor.submit(convert_one, iso_path) for iso_path in iso_files]
+            for idx, future in enumerate(concurrent.futures.as_completed(futures), start=1):
+                iso_xbox_source, returncode, stderr = future.result()
+
+                if returncode != 0:
+                    err_msg = f"Erreur lors de la conversion de l'ISO: {stderr}"
+                    logger.error(err_msg)
+                    # Statut d'erreur publié seulement une fois les conversions en cours terminées
+                    stop_conversions(futures)
+                    # Mettre à jour les statuts pour éviter de rester bloqué en 'Converting'
                     try:
-                        os.remove(old_file)
-                        logger.debug(f"Fichier backup .old supprimé: {old_file}")
-                    except Exception as e:
-                        logger.warning(f"Impossible de supprimer le fichier .old: {e}")
+                        if url:
+                            _set_progress(url, status="Error", message=stderr, progress_percent=0)
+                            if hist_entry is not None and hist_entry.get("status") in _XBOX_HISTORY_STATUSES:
+                                hist_entry["status"] = "Error"
+                                hist_entry["message"] = stderr
+                                _save_history_now()
+                    except Exception:
+                        pass
+                    return False, err_msg
+
+                # Vérifier que l'ISO existe toujours (extract-xiso le modifie en place)
+                if os.path.exists(iso_xbox_source):
+                    logger.info(f"ISO repackagé avec succès: {iso_xbox_source}")
+                    logger.debug(f"ISO converti au format XISO en place")
                 
-                # Mise à jour progression de conversion (coarse-grain)
-                try:
-                    percent = int(idx / total * 100) if total > 0 else 100
-                    if url:
-                        if url not in config.download_progress:
-                            config.download_progress[url] = {}
-                        config.download_progress[url]["status"] = "Converting"
-                        config.download_progress[url]["progress_percent"] = percent
-                        config.needs_redraw = True
-                        if isinstance(config.history, list):
-                            for entry in config.history:
-                                if entry.get("url") == url and entry.get("status") == "Converting":
-                                    entry["progress"] = percent
-                                    save_history(config.history)
-                                    break
-                except Exception:
-                    pass
-            else:
-                err_msg = f"L'ISO source a disparu après conversion: {iso_xbox_source}"
-                logger.error(err_msg)
-                try:
-                    if url:
-                        if url not in config.download_progress:
-                            config.download_progress[url] = {}
-                        config.download_progress[url]["status"] = "Error"
-                        config.download_progress[url]["message"] = err_msg
-                        config.download_progress[url]["progress_percent"] = 0
-                        config.needs_redraw = True
-                        if isinstance(config.history, list):
-                            for entry in config.history:
-                                if entry.get("url") == url and entry.get("status") in ("Converting", "Extracting", "Téléchargement", "Downloading"):
-                                    entry["status"] = "Error"
-                                    entry["message"] = err_msg
-                                    save_history(config.history)
-                                    break
-                except Exception:
-                    pass
-                return False, "Échec de la conversion de l'ISO"
+                    # Supprimer tout de suite le fichier .old créé par extract-xiso (backup de la taille de l'ISO)
+                    _remove_xiso_backup(iso_xbox_source)
+                
+                    # Mise à jour progression de conversion (coarse-grain)
+                    try:
+                        percent = int(idx / total * 100) if total > 0 else 100
+                        if url:
+                            _set_progress(url, status="Converting", progress_percent=percent)
+                            if hist_entry is not None and hist_entry.get("status") == "Converting":
+                                hist_entry["progress"] = percent
+                                # Sauvegarde différée: au plus un dump JSON complet toutes les 0.5s
+                                _mark_history_dirty()
+                        _flush_history_if_due(time.time())
+                    except Exception:
+                        pass
+                else:
+                    err_msg = f"L'ISO source a disparu après conversion: {iso_xbox_source}"
+                    logger.error(err_msg)
+                    stop_conversions(futures)
+                    try:
+                        if url:
+                            _set_progress(url, status="Error", message=err_msg, progress_percent=0)
+                            if hist_entry is not None and hist_entry.get("status") in _XBOX_HISTORY_STATUSES:
+                                hist_entry["status"] = "Error"
+                                hist_entry["message"] = err_msg
+                                _save_history_now()
+                    except Exception:
+                        pass
+                    return False, "Échec de la conversion de l'ISO"
 
         # Conversion terminée avec succès - mettre à jour le statut final
         try:
             if url:
-                if url not in config.download_progress:
-                    config.download_progress[url] = {}
-                config.download_progress[url]["status"] = "Download_OK"
-                config.download_progress[url]["progress_percent"] = 100
-                config.needs_redraw = True
-                if isinstance(config.history, list):
-                    for entry in config.history:
-                        if entry.get("url") == url and entry.get("status") == "Converting":
-                            entry["status"] = "Download_OK"
-                            entry["progress"] = 100
-                            entry["message"] = "Xbox conversion completed successfully"
-                            save_history(config.history)
-                            break
+                _set_progress(url, status="Download_OK", progress_percent=100)
+                if hist_entry is not None and hist_entry.get("status") == "Converting":
+                    hist_entry["status"] = "Download_OK"
+                    hist_entry["progress"] = 100
+                    hist_entry["message"] = "Xbox conversion completed successfully"
+                    _save_history_now()
         except Exception as e:
             logger.debug(f"MAJ statut final conversion ignorée: {e}")
 
@@ -2310,6 +3081,8 @@ def handle_xbox(dest_dir, iso_files, url=None):
 
 
 
+_music_state = {"endevent_set": False}
+
 def play_random_music(music_files, music_folder, current_music=None):
     if not getattr(config, "music_enabled", True) or not is_mixer_available():
         if is_mixer_available():
@@ -2327,10 +3100,14 @@ def play_random_music(music_files, music_folder, current_music=None):
         def load_and_play_music():
             try:
                 if is_mixer_available():
+                    # Lecture en flux (mixer.music): la piste n'est jamais décodée entièrement en mémoire
                     pygame.mixer.music.load(music_path)
+                    if not _music_state["endevent_set"]:
+                        # Événement de fin, défini une fois pour toutes (avant le premier play)
+                        pygame.mixer.music.set_endevent(pygame.USEREVENT + 1)
+                        _music_state["endevent_set"] = True
                     pygame.mixer.music.set_volume(0.5)
                     pygame.mixer.music.play(loops=0)  # Jouer une seule fois
-                    pygame.mixer.music.set_endevent(pygame.USEREVENT + 1)  # Événement de fin
                     set_music_popup(music_file)  # Afficher le nom de la musique dans la popup
             except Exception as e:
                 logger.error(f"Erreur lors du chargement de la musique {music_path}: {str(e)}")
@@ -2350,6 +3127,26 @@ def set_music_popup(music_name):
     config.music_popup_start_time = pygame.time.get_ticks() / 1000  # Temps actuel en secondes
     config.needs_redraw = True  # Forcer le redraw pour afficher le nom de la musique
 
+# Clés API des hébergeurs: {nom: (attribut config de la clé, attribut config du chemin du fichier)}
+_API_KEY_SPEC = {
+    '1fichier': ('API_KEY_1FICHIER', 'API_KEY_1FICHIER_PATH'),
+    'alldebrid': ('API_KEY_ALLDEBRID', 'API_KEY_ALLDEBRID_PATH'),
+    'realdebrid': ('API_KEY_REALDEBRID', 'API_KEY_REALDEBRID_PATH'),
+}
+
+def _current_api_keys(reloaded):
+    """Valeurs courantes des clés API (format de retour de load_api_keys)."""
+    keys = {key_name: getattr(config, attr, '') for key_name, (attr, _path_attr) in _API_KEY_SPEC.items()}
+    keys['reloaded'] = reloaded
+    return keys
+
+def _stat_mtime_ns(path):
+    """mtime en nanosecondes (entier, un seul stat), ou None si le fichier est absent/inaccessible."""
+    try:
+        return os.stat(path).st_mtime_ns
+    except OSError:
+        return None
+
 def load_api_keys(force: bool = False):
     """Charge les clés API (1fichier, AllDebrid, RealDebrid) en une seule passe.
 
@@ -2361,33 +3158,33 @@ def load_api_keys(force: bool = False):
     Retourne: { '1fichier': str, 'alldebrid': str, 'realdebrid': str, 'reloaded': bool }
     """
     try:
-        paths = {
-            '1fichier': getattr(config, 'API_KEY_1FICHIER_PATH', ''),
-            'alldebrid': getattr(config, 'API_KEY_ALLDEBRID_PATH', ''),
-            'realdebrid': getattr(config, 'API_KEY_REALDEBRID_PATH', ''),
-        }
+        paths = {key_name: getattr(config, path_attr, '') for key_name, (_attr, path_attr) in _API_KEY_SPEC.items()}
         cache_attr = '_api_keys_cache'
         if not hasattr(config, cache_attr):
             setattr(config, cache_attr, {'1fichier_mtime': None, 'alldebrid_mtime': None, 'realdebrid_mtime': None})
         cache_data = getattr(config, cache_attr)
         reloaded = False
 
+        # Un seul stat par fichier; si aucun mtime n'a bougé depuis le dernier appel, rien à relire
+        mtimes = {key_name: _stat_mtime_ns(path) for key_name, path in paths.items() if path}
+        epoch = tuple(mtimes.items())
+        if not force and None not in mtimes.values() and epoch == cache_data.get('epoch'):
+            return _current_api_keys(False)
+
         for key_name, path in paths.items():
             if not path:
                 continue
+            mtime = mtimes[key_name]
             # Création fichier vide si absent
-            try:
-                if not os.path.exists(path):
+            if mtime is None:
+                try:
                     os.makedirs(os.path.dirname(path), exist_ok=True)
                     with open(path, 'w', encoding='utf-8') as f:
                         f.write("")
-            except Exception as ce:
-                logger.error(f"Impossible de préparer le fichier clé {key_name}: {ce}")
-                continue
-            try:
-                mtime = os.path.getmtime(path)
-            except Exception:
-                mtime = None
+                except Exception as ce:
+                    logger.error(f"Impossible de préparer le fichier clé {key_name}: {ce}")
+                    continue
+                mtime = mtimes[key_name] = _stat_mtime_ns(path)
             cache_key = f"{key_name}_mtime"
             if force or (mtime is not None and mtime != cache_data.get(cache_key)):
                 # Lecture
@@ -2398,28 +3195,14 @@ def load_api_keys(force: bool = False):
                     logger.error(f"Erreur lecture clé {key_name}: {re}")
                     value = ""
                 # Assignation dans config
-                if key_name == '1fichier':
-                    config.API_KEY_1FICHIER = value
-                elif key_name == 'alldebrid':
-                    config.API_KEY_ALLDEBRID = value
-                elif key_name == 'realdebrid':
-                    config.API_KEY_REALDEBRID = value
+                setattr(config, _API_KEY_SPEC[key_name][0], value)
                 cache_data[cache_key] = mtime
                 reloaded = True
-        return {
-            '1fichier': getattr(config, 'API_KEY_1FICHIER', ''),
-            'alldebrid': getattr(config, 'API_KEY_ALLDEBRID', ''),
-            'realdebrid': getattr(config, 'API_KEY_REALDEBRID', ''),
-            'reloaded': reloaded
-        }
+        cache_data['epoch'] = tuple(mtimes.items())
+        return _current_api_keys(reloaded)
     except Exception as e:
         logger.error(f"Erreur load_api_keys: {e}")
-        return {
-            '1fichier': getattr(config, 'API_KEY_1FICHIER', ''),
-            'alldebrid': getattr(config, 'API_KEY_ALLDEBRID', ''),
-            'realdebrid': getattr(config, 'API_KEY_REALDEBRID', ''),
-            'reloaded': False
-        }
+        return _current_api_keys(False)
 
 
 def save_api_keys(api_keys: dict):
@@ -2433,15 +3216,11 @@ def save_api_keys(api_keys: dict):
     if not api_keys:
         return False
     
-    paths = {
-        '1fichier': getattr(config, 'API_KEY_1FICHIER_PATH', ''),
-        'alldebrid': getattr(config, 'API_KEY_ALLDEBRID_PATH', ''),
-        'realdebrid': getattr(config, 'API_KEY_REALDEBRID_PATH', ''),
-    }
-    
     saved_any = False
+    cache_data = getattr(config, '_api_keys_cache', None)
     
-    for key_name, path in paths.items():
+    for key_name, (attr, path_attr) in _API_KEY_SPEC.items():
+        path = getattr(config, path_attr, '')
         if not path:
             continue
         
@@ -2455,22 +3234,17 @@ def save_api_keys(api_keys: dict):
             os.makedirs(os.path.dirname(path), exist_ok=True)
             
             # Écrire la clé (valeur nettoyée)
+            value = value.strip()
             with open(path, 'w', encoding='utf-8') as f:
-                f.write(value.strip())
+                f.write(value)
             
             # Mettre à jour le cache config
-            if key_name == '1fichier':
-                config.API_KEY_1FICHIER = value.strip()
-            elif key_name == 'alldebrid':
-                config.API_KEY_ALLDEBRID = value.strip()
-            elif key_name == 'realdebrid':
-                config.API_KEY_REALDEBRID = value.strip()
+            setattr(config, attr, value)
             
             # Invalider le cache mtime
-            cache_attr = '_api_keys_cache'
-            if hasattr(config, cache_attr):
-                cache_data = getattr(config, cache_attr)
+            if cache_data is not None:
                 cache_data[f"{key_name}_mtime"] = None
+                cache_data['epoch'] = None
             
             saved_any = True
             logger.info(f"Clé API {key_name} sauvegardée avec succès")
@@ -2565,8 +3339,10 @@ def check_web_service_status():
 
 
 
+@functools.lru_cache(maxsize=256)
 def normalize_platform_name(platform):
-    """Normalise un nom de plateforme en supprimant espaces et convertissant en minuscules."""
+    """Normalise un nom de plateforme en supprimant espaces et convertissant en minuscules.
+    Mis en cache: fonction pure, appelée avec un petit ensemble de noms de plateformes."""
     return platform.lower().replace(" ", "")
 
 
@@ -2584,12 +3360,14 @@ def find_file_with_or_without_extension(base_path, filename):
     name_without_ext, ext = os.path.splitext(filename)
     if ext:  # Si le fichier a une extension
         # Chercher tous les fichiers commençant par le nom sans extension
-        if os.path.exists(base_path):
-            for existing_file in os.listdir(base_path):
-                existing_name, _ = os.path.splitext(existing_file)
-                if existing_name == name_without_ext:
-                    found_path = os.path.join(base_path, existing_file)
-                    return True, existing_file, found_path
+        try:
+            with os.scandir(base_path) as it:
+                for entry in it:
+                    # startswith écarte la plupart des entrées sans appeler splitext
+                    if entry.name.startswith(name_without_ext) and os.path.splitext(entry.name)[0] == name_without_ext:
+                        return True, entry.name, entry.path
+        except OSError:
+            pass  # Dossier inexistant ou illisible
     
     # 3. Fichier non trouvé
     return False, filename, full_path